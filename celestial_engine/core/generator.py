@@ -326,7 +326,7 @@ Write the FULL expanded section (including the original content plus expansions)
         Returns:
             True if entry passes quick checks
         """
-        validation_result = self.validator.validate(entry)
+        validation_result = self.validator.validate(entry, full=False)
         entry.validation_result = validation_result
 
         return validation_result.passed
@@ -75,9 +75,9 @@ class Section:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Results from entry validation."""
+    """Results from entry validation (immutable once produced)."""
     overall_score: float
     tier: QualityTier
     passed: bool
@@ -4,19 +4,123 @@ Implements the CELESTIAL-tier validation criteria.
 """
 
 import re
+import bisect
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Any
-from collections import Counter
+from typing import Dict, List, Tuple, Any, Iterable, Optional, Callable
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
-from ..core.models import Entry, ValidationResult, QualityTier
+from ..core.models import Entry, Section, ValidationResult, QualityTier
 from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Validator owned by each validate_batch worker process
+_WORKER_VALIDATOR: Optional["EntryValidator"] = None
+
+
+def _init_worker():
+    """Build the worker process's validator once, when the process starts."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = EntryValidator()
+
+
+def _validate_in_worker(entry: Entry) -> ValidationResult:
+    """Validate one entry with the worker process's validator."""
+    return _WORKER_VALIDATOR.validate(entry)
+
+
+# Minimum score for each tier above UNRANKED, ascending; _TIERS[i] is the tier
+# for scores with exactly i thresholds at or below them
+_TIER_THRESHOLDS = (70, 75, 80, 85, 90, 95)
+_TIERS = (
+    QualityTier.UNRANKED,
+    QualityTier.BRONZE,
+    QualityTier.SILVER,
+    QualityTier.GOLD,
+    QualityTier.PLATINUM,
+    QualityTier.ADAMANTINE,
+    QualityTier.CELESTIAL
+)
+
+
+def _make_weighted_scorer(weights: Dict[str, float]) -> Callable[..., float]:
+    """
+    Specialize the overall-score formula for a fixed set of criterion weights.
+
+    Weights do not change after configuration load, so they are bound once as
+    closure constants instead of being looked up in the dict on every call.
+    """
+    w_word_count = weights["word_count"]
+    w_theological_depth = weights["theological_depth"]
+    w_coherence = weights["coherence"]
+    w_section_balance = weights["section_balance"]
+    w_orthodox_perspective = weights["orthodox_perspective"]
+
+    def weighted_score(
+        word_count: float,
+        theological_depth: float,
+        coherence: float,
+        section_balance: float,
+        orthodox_perspective: float
+    ) -> float:
+        return (
+            word_count * w_word_count +
+            theological_depth * w_theological_depth +
+            coherence * w_coherence +
+            section_balance * w_section_balance +
+            orthodox_perspective * w_orthodox_perspective
+        )
+
+    return weighted_score
+
+
+def _population_std_dev(values: List[int]) -> float:
+    """Population standard deviation of a non-empty list of counts."""
+    n = len(values)
+    mean = sum(values) / n
+    return (sum((x - mean) ** 2 for x in values) / n) ** 0.5
+
+
+def _literal_alternation(literals: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the given literal strings.
+
+    The literals are merged into a character trie so shared prefixes
+    (e.g. "st. gregory ") are matched once rather than once per alternative.
+    Where one literal is a prefix of another, the longer one is preferred.
+    A space in a literal matches any run of whitespace.
+    """
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node: Dict[str, Any]) -> str:
+        optional = "" in node
+        branches = [
+            (r'\s+' if char == " " else re.escape(char)) + build(child)
+            for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return build(trie)
+
 
 class EntryValidator:
     """Validates entries against CELESTIAL-tier standards."""
 
+    # Maximum number of per-section feature sets kept for re-validation
+    SECTION_CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize validator."""
         self.config = get_config()
@@ -30,76 +134,164 @@ class EntryValidator:
             "section_balance": validation_config.get("section_balance", {}).get("weight", 0.15),
             "orthodox_perspective": validation_config.get("orthodox_perspective", {}).get("weight", 0.10)
         }
+        self._weighted_score = _make_weighted_scorer(self.weights)
+
+        # Church Fathers, matched by canonical name against lowercased text
+        self.father_names = [
+            "St. Gregory of Nyssa",
+            "St. Maximus the Confessor",
+            "St. Basil the Great",
+            "St. John Chrysostom",
+            "St. Athanasius",
+            "St. Gregory Palamas",
+            "St. John of Damascus",
+            "St. Ignatius",
+            "St. Irenaeus",
+            "St. Cyril of Alexandria",
+            "St. Isaac the Syrian",
+            "St. Symeon the New Theologian",
+            "St. Gregory the Theologian",
+            "St. John Cassian",
+            "St. Ephrem the Syrian"
+        ]
 
-        # Church Fathers patterns for detection
-        self.father_patterns = [
-            r'St\.\s+Gregory\s+of\s+Nyssa',
-            r'St\.\s+Maximus\s+the\s+Confessor',
-            r'St\.\s+Basil\s+the\s+Great',
-            r'St\.\s+John\s+Chrysostom',
-            r'St\.\s+Athanasius',
-            r'St\.\s+Gregory\s+Palamas',
-            r'St\.\s+John\s+of\s+Damascus',
-            r'St\.\s+Ignatius',
-            r'St\.\s+Irenaeus',
-            r'St\.\s+Cyril\s+of\s+Alexandria',
-            r'St\.\s+Isaac\s+the\s+Syrian',
-            r'St\.\s+Symeon\s+the\s+New\s+Theologian',
-            r'St\.\s+Gregory\s+the\s+Theologian',
-            r'St\.\s+John\s+Cassian',
-            r'St\.\s+Ephrem\s+the\s+Syrian'
+        # Patristic work titles, matched literally against lowercased text
+        self.work_titles = [
+            "On the Making of Man", "De Hominis Opificio",
+            "Ambigua", "Difficulty", "Difficulties",
+            "On the Holy Spirit", "De Spiritu Sancto",
+            "Against the Heathen", "Contra Gentes",
+            "Triads in Defense", "Triads",
+            "Exact Exposition of the Orthodox Faith",
+            "Ladder of Divine Ascent",
+            "On the Incarnation",
+            "The Life of Moses",
+            "Against Eunomius",
+            "Mystagogy",
+            "Chapters on Charity", "Chapters on Love", "Chapters on Knowledge"
         ]
 
-        # Patristic works patterns
+        # Patristic works that need a pattern (lowercased text)
         self.work_patterns = [
-            r'(On\s+the\s+Making\s+of\s+Man|De\s+Hominis\s+Opificio)',
-            r'(Ambigua|Difficulty|Difficulties)',
-            r'(On\s+the\s+Holy\s+Spirit|De\s+Spiritu\s+Sancto)',
-            r'(Homilies\s+on\s+[A-Z]\w+)',
-            r'(Against\s+the\s+Heathen|Contra\s+Gentes)',
-            r'(Triads\s+in\s+Defense|Triads)',
-            r'(Exact\s+Exposition\s+of\s+the\s+Orthodox\s+Faith)',
-            r'(Ladder\s+of\s+Divine\s+Ascent)',
-            r'(On\s+the\s+Incarnation)',
-            r'(The\s+Life\s+of\s+Moses)',
-            r'(Against\s+Eunomius)',
-            r'(Mystagogy)',
-            r'(Chapters\s+on\s+(Charity|Love|Knowledge))',
-            r'(Commentary\s+on\s+[A-Z]\w+)'
+            r'homilies\s+on\s+[a-z]\w+',
+            r'commentary\s+on\s+[a-z]\w+'
+        ]
+
+        # Western contrast patterns (lowercased text)
+        self.western_patterns = [
+            r'\b(?:western|catholic|protestant|latin)\s+(?:theology|tradition|understanding)',
+            r'(?:in\s+contrast|differs\s+from|unlike)\s+(?:western|catholic|protestant)',
+            r'(?:catholic|protestant)\s+(?:view|understanding|doctrine)'
+        ]
+
+        # General Patristic vocabulary (lowercased text)
+        self.patristic_term_pattern = r'patristic|fathers|church\s+father'
+
+        # Liturgical/lived experience words ("Divine Liturgy" is counted via "liturgy")
+        self.lived_terms = frozenset({
+            "liturgy", "liturgical", "prayer", "praxis", "sacrament", "icon",
+            "monastery", "monastic", "hesychasm", "ascetic",
+            "eucharist", "baptism"
+        })
+
+        # Orthodox theological terms
+        self.orthodox_terms = frozenset({
+            "theosis", "energies", "essence", "hypostasis", "ousia", "physis", "perichoresis",
+            "apophatic", "cataphatic", "hesychasm", "synergy", "uncreated", "nous",
+            "deification", "transfiguration", "icon", "liturgy"
+        })
+
+        # Cross-reference phrases like "as discussed in", "as we saw", "building on" (lowercased text)
+        self.cross_ref_patterns = [
+            r'as\s+(?:discussed|mentioned|seen|noted|explored)\s+in',
+            r'building\s+on',
+            r'returning\s+to',
+            r'as\s+we\s+(?:saw|discussed|noted)',
+            r'earlier\s+discussion',
+            r'previous\s+section'
         ]
 
-    def validate(self, entry: Entry) -> ValidationResult:
+        # One master alternation over lowercased text, one named group per family.
+        # Fathers and work titles are prefix-factored literal alternations (regex tries).
+        # Single-word vocabularies (Orthodox framing, lived references, Orthodox terms)
+        # overlap these families and are counted from word tokens instead.
+        families = {
+            "father": _literal_alternation(name.lower() for name in self.father_names),
+            "work": "|".join(
+                [_literal_alternation(title.lower() for title in self.work_titles)] + self.work_patterns
+            ),
+            "western": "|".join(self.western_patterns),
+            "patristic": self.patristic_term_pattern,
+            "cross_ref": "|".join(self.cross_ref_patterns)
+        }
+        self.master_regex = re.compile(
+            "|".join(f"(?P<{family}>{pattern})" for family, pattern in families.items())
+        )
+
+        # Scripture references: book abbreviation followed by a chapter number (case-sensitive)
+        self.scripture_books = [
+            "Gen.", "Exod.", "Matt.", "John", "Rom.", "Cor.", "Gal.",
+            "Eph.", "Phil.", "Col.", "Heb.", "James", "Pet.", "Rev."
+        ]
+        self.scripture_regex = re.compile(
+            r'\b' + _literal_alternation(self.scripture_books) + r'\s+\d+'
+        )
+
+        # Word tokenizer for single-word vocabularies; \w+ runs match \b...\b boundaries
+        self.word_regex = re.compile(r'\w+')
+
+        # Section features keyed by content hash, in least-recently-used order
+        self._section_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    def validate(self, entry: Entry, full: bool = True) -> ValidationResult:
         """
         Comprehensively validate an entry.
 
         Args:
             entry: Entry to validate
+            full: Score every criterion even for entries that clearly cannot
+                reach CELESTIAL tier. With full=False such entries (under half
+                the minimum word count, or fewer than 5 Patristic citations)
+                get an early UNRANKED result without criterion scores.
 
         Returns:
             ValidationResult with scores and feedback
         """
         logger.info(f"Validating entry: {entry.topic}")
 
+        # Section lengths and minimums, read once for the length-based criteria
+        word_counts = [s.word_count for s in entry.sections]
+        section_minimums = [s.min_words for s in entry.sections]
+        total_words = sum(word_counts)
+
+        # Scan each section once; every criterion is derived from these features
+        features = [self._section_features(section) for section in entry.sections]
+        totals = self._sum_features(features)
+        stats = self._collect_statistics(total_words, totals)
+
+        if not full and self._is_disqualified(stats):
+            return self._disqualified_result(stats)
+
         # Calculate individual criterion scores
-        word_count_score = self._validate_word_count(entry)
-        theological_depth_score = self._validate_theological_depth(entry)
-        coherence_score = self._validate_coherence(entry)
-        section_balance_score = self._validate_section_balance(entry)
-        orthodox_perspective_score = self._validate_orthodox_perspective(entry)
+        word_count_score = self._validate_word_count(total_words, word_counts, section_minimums)
+        theological_depth_score = self._validate_theological_depth(stats)
+        coherence_score = self._validate_coherence(entry, totals["cross_refs"])
+        section_balance_score = self._validate_section_balance(word_counts, section_minimums)
+        orthodox_perspective_score = self._validate_orthodox_perspective(totals)
 
         # Calculate quality metrics
-        diversity_score = self._calculate_diversity_score(entry)
-        specificity_score = self._calculate_specificity_score(entry)
-        integration_score = self._calculate_integration_score(entry)
-        distribution_score = self._calculate_distribution_score(entry)
+        diversity_score = self._calculate_diversity_score(totals)
+        specificity_score = self._calculate_specificity_score(totals)
+        integration_score = self._calculate_integration_score(features)
+        distribution_score = self._calculate_distribution_score(features)
 
         # Calculate overall score
-        overall_score = (
-            word_count_score * self.weights["word_count"] +
-            theological_depth_score * self.weights["theological_depth"] +
-            coherence_score * self.weights["coherence"] +
-            section_balance_score * self.weights["section_balance"] +
-            orthodox_perspective_score * self.weights["orthodox_perspective"]
+        overall_score = self._weighted_score(
+            word_count_score,
+            theological_depth_score,
+            coherence_score,
+            section_balance_score,
+            orthodox_perspective_score
         )
 
         # Determine tier
@@ -114,9 +306,6 @@ class EntryValidator:
             distribution_score >= 85
         )
 
-        # Collect statistics
-        stats = self._collect_statistics(entry)
-
         # Generate feedback
         strengths, weaknesses, suggestions = self._generate_feedback(
             entry,
@@ -159,9 +348,73 @@ class EntryValidator:
 
         return result
 
-    def _validate_word_count(self, entry: Entry) -> float:
+    def validate_batch(
+        self,
+        entries: List[Entry],
+        max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """
+        Validate many entries in parallel worker processes.
+
+        Each worker builds its own validator (and compiled patterns) once and
+        reuses it for every entry it is handed.
+
+        Args:
+            entries: Entries to validate
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            ValidationResults in the same order as entries
+        """
+        if len(entries) < 2 or max_workers == 1:
+            return [self.validate(entry) for entry in entries]
+
+        logger.info(f"Validating {len(entries)} entries in parallel")
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_validate_in_worker, entries, chunksize=4))
+
+    def _is_disqualified(self, stats: Dict[str, int]) -> bool:
+        """Check whether an entry is too incomplete to be worth scoring in full."""
+        min_words = self.config.get("entry.word_counts.total_min", 11000)
+        return stats["total_words"] < 0.5 * min_words or stats["patristic_citations"] < 5
+
+    def _disqualified_result(self, stats: Dict[str, int]) -> ValidationResult:
+        """Build an UNRANKED result for an entry that failed the early checks."""
+        logger.info("Validation short-circuited: entry too incomplete for full scoring")
+
+        return ValidationResult(
+            overall_score=0.0,
+            tier=QualityTier.UNRANKED,
+            passed=False,
+            word_count_score=0.0,
+            theological_depth_score=0.0,
+            coherence_score=0.0,
+            section_balance_score=0.0,
+            orthodox_perspective_score=0.0,
+            diversity_score=0.0,
+            specificity_score=0.0,
+            integration_score=0.0,
+            distribution_score=0.0,
+            weaknesses=[
+                f"Entry too incomplete for full validation: {stats['total_words']} words, "
+                f"{stats['patristic_citations']} Patristic citations"
+            ],
+            suggestions=["Entry too short / too few citations for full validation"],
+            total_words=stats["total_words"],
+            patristic_citations=stats["patristic_citations"],
+            scripture_references=stats["scripture_references"],
+            unique_fathers=stats["unique_fathers"],
+            named_works=stats["named_works"]
+        )
+
+    def _validate_word_count(
+        self,
+        total_words: int,
+        word_counts: List[int],
+        section_minimums: List[int]
+    ) -> float:
         """Validate word count requirements."""
-        total_words = entry.total_words
         min_words = self.config.get("entry.word_counts.total_min", 11000)
 
         score = 100.0
@@ -173,21 +426,19 @@ class EntryValidator:
             score -= penalty
 
         # Check individual sections
-        for section in entry.sections:
-            if section.word_count < section.min_words:
-                section_deficit = section.min_words - section.word_count
-                penalty = min((section_deficit / section.min_words) * 20, 15)
+        for word_count, section_min in zip(word_counts, section_minimums):
+            if word_count < section_min:
+                section_deficit = section_min - word_count
+                penalty = min((section_deficit / section_min) * 20, 15)
                 score -= penalty
 
-            if section.word_count < 500:
+            if word_count < 500:
                 score -= 50
 
         return max(score, 0.0)
 
-    def _validate_theological_depth(self, entry: Entry) -> float:
+    def _validate_theological_depth(self, stats: Dict[str, int]) -> float:
         """Validate theological depth."""
-        stats = self._collect_statistics(entry)
-
         score = 100.0
 
         # Patristic citations requirement (20+)
@@ -217,12 +468,11 @@ class EntryValidator:
 
         return max(score, 0.0)
 
-    def _validate_coherence(self, entry: Entry) -> float:
+    def _validate_coherence(self, entry: Entry, cross_refs: int) -> float:
         """Validate logical flow and coherence."""
         score = 100.0
 
         # Check for cross-references between sections
-        cross_refs = self._count_cross_references(entry)
         if cross_refs < 5:
             score -= (5 - cross_refs) * 5
 
@@ -236,18 +486,15 @@ class EntryValidator:
 
         return max(score, 0.0)
 
-    def _validate_section_balance(self, entry: Entry) -> float:
+    def _validate_section_balance(self, word_counts: List[int], section_minimums: List[int]) -> float:
         """Validate section balance."""
         score = 100.0
 
         # Calculate variance in section lengths
-        word_counts = [s.word_count for s in entry.sections]
         if not word_counts:
             return 0.0
 
-        mean = sum(word_counts) / len(word_counts)
-        variance = sum((x - mean) ** 2 for x in word_counts) / len(word_counts)
-        std_dev = variance ** 0.5
+        std_dev = _population_std_dev(word_counts)
 
         # Penalize high variance
         if std_dev > 500:
@@ -255,57 +502,38 @@ class EntryValidator:
             score -= penalty
 
         # Check for sections below minimum
-        for section in entry.sections:
-            if section.word_count < section.min_words:
-                ratio = section.word_count / section.min_words
+        for word_count, section_min in zip(word_counts, section_minimums):
+            if word_count < section_min:
+                ratio = word_count / section_min
                 penalty = (1 - ratio) * 30
                 score -= penalty
 
         return max(score, 0.0)
 
-    def _validate_orthodox_perspective(self, entry: Entry) -> float:
+    def _validate_orthodox_perspective(self, totals: Dict[str, Any]) -> float:
         """Validate Orthodox perspective and framing."""
-        full_text = " ".join(s.content for s in entry.sections)
-
         score = 100.0
 
         # Check for Orthodox framing (10+ instances)
-        orthodox_mentions = len(re.findall(r'\b(Orthodox|Eastern Orthodox)\b', full_text, re.IGNORECASE))
+        orthodox_mentions = totals["orthodox_mentions"]
         if orthodox_mentions < 10:
             score -= (10 - orthodox_mentions) * 3
 
         # Check for Western contrasts (3+)
-        western_patterns = [
-            r'\b(Western|Catholic|Protestant|Latin)\s+(theology|tradition|understanding)',
-            r'(in\s+contrast|differs\s+from|unlike)\s+(Western|Catholic|Protestant)',
-            r'(Catholic|Protestant)\s+(view|understanding|doctrine)'
-        ]
-        western_contrasts = sum(len(re.findall(p, full_text, re.IGNORECASE)) for p in western_patterns)
+        western_contrasts = totals["western_contrasts"]
         if western_contrasts < 3:
             score -= (3 - western_contrasts) * 5
 
         # Check for liturgical/lived experience references
-        lived_patterns = [
-            r'\b(liturgy|liturgical|prayer|praxis|sacrament|icon)\b',
-            r'\b(monastery|monastic|hesychasm|ascetic)\b',
-            r'\b(Divine\s+Liturgy|Eucharist|baptism)\b'
-        ]
-        lived_refs = sum(len(re.findall(p, full_text, re.IGNORECASE)) for p in lived_patterns)
+        lived_refs = totals["lived_refs"]
         if lived_refs < 5:
             score -= (5 - lived_refs) * 4
 
         return max(score, 0.0)
 
-    def _calculate_diversity_score(self, entry: Entry) -> float:
+    def _calculate_diversity_score(self, totals: Dict[str, Any]) -> float:
         """Calculate citation diversity (unique Church Fathers cited)."""
-        full_text = " ".join(s.content for s in entry.sections)
-
-        fathers_cited = set()
-        for pattern in self.father_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                fathers_cited.add(pattern)
-
-        count = len(fathers_cited)
+        count = len(totals["father_counts"])
 
         if count >= 5:
             return 100.0
@@ -316,14 +544,9 @@ class EntryValidator:
         else:
             return 40.0
 
-    def _calculate_specificity_score(self, entry: Entry) -> float:
+    def _calculate_specificity_score(self, totals: Dict[str, Any]) -> float:
         """Calculate specificity (named Patristic works)."""
-        full_text = " ".join(s.content for s in entry.sections)
-
-        works_cited = 0
-        for pattern in self.work_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
-            works_cited += len(matches)
+        works_cited = totals["named_works"]
 
         if works_cited >= 3:
             return 100.0
@@ -334,23 +557,14 @@ class EntryValidator:
         else:
             return 20.0
 
-    def _calculate_integration_score(self, entry: Entry) -> float:
+    def _calculate_integration_score(self, features: List[Dict[str, Any]]) -> float:
         """Calculate citation integration (distribution across sections)."""
-        section_citation_counts = []
-
-        for section in entry.sections:
-            citation_count = sum(
-                len(re.findall(pattern, section.content, re.IGNORECASE))
-                for pattern in self.father_patterns
-            )
-            section_citation_counts.append(citation_count)
+        section_citation_counts = [sum(f["father_counts"].values()) for f in features]
 
         if not section_citation_counts or sum(section_citation_counts) == 0:
             return 0.0
 
-        mean_citations = sum(section_citation_counts) / len(section_citation_counts)
-        variance = sum((x - mean_citations) ** 2 for x in section_citation_counts) / len(section_citation_counts)
-        std_dev = variance ** 0.5
+        std_dev = _population_std_dev(section_citation_counts)
 
         # Lower variance = better distribution
         if std_dev < 2:
@@ -362,21 +576,12 @@ class EntryValidator:
         else:
             return 50.0
 
-    def _calculate_distribution_score(self, entry: Entry) -> float:
+    def _calculate_distribution_score(self, features: List[Dict[str, Any]]) -> float:
         """Calculate Patristic content distribution across sections."""
-        patristic_sections = 0
-
-        for section in entry.sections:
-            has_father_citation = any(
-                re.search(pattern, section.content, re.IGNORECASE)
-                for pattern in self.father_patterns
-            )
-            has_patristic_terms = bool(
-                re.search(r'(Patristic|Fathers|Church\s+Father)', section.content, re.IGNORECASE)
-            )
-
-            if has_father_citation or has_patristic_terms:
-                patristic_sections += 1
+        patristic_sections = sum(
+            1 for f in features
+            if f["father_counts"] or f["has_patristic_term"]
+        )
 
         if patristic_sections >= 5:
             return 100.0
@@ -387,70 +592,89 @@ class EntryValidator:
         else:
             return 40.0
 
-    def _collect_statistics(self, entry: Entry) -> Dict[str, int]:
-        """Collect entry statistics."""
-        full_text = " ".join(s.content for s in entry.sections)
+    def _section_features(self, section: Section) -> Dict[str, Any]:
+        """
+        Return the counts every criterion is derived from for one section.
 
-        # Count Patristic citations
-        patristic_citations = sum(
-            len(re.findall(pattern, full_text, re.IGNORECASE))
-            for pattern in self.father_patterns
-        )
+        Features are cached by a hash of the section content, so sections left
+        unchanged between refinement iterations are not rescanned. Cached
+        feature dicts are shared and must not be mutated.
+        """
+        key = hashlib.blake2b(section.content.encode("utf-8"), digest_size=16).digest()
+        features = self._section_cache.get(key)
+        if features is not None:
+            self._section_cache.move_to_end(key)
+            return features
+
+        features = self._scan_section(section.content)
+        self._section_cache[key] = features
+        if len(self._section_cache) > self.SECTION_CACHE_SIZE:
+            self._section_cache.popitem(last=False)
+        return features
+
+    def _scan_section(self, content: str) -> Dict[str, Any]:
+        """Scan section content once and return its feature counts."""
+        lowered = content.lower()
+
+        # Master scan: bucket each match by the family group it came from
+        father_counts: Counter = Counter()
+        family_counts = {"work": 0, "western": 0, "patristic": 0, "cross_ref": 0}
+        for match in self.master_regex.finditer(lowered):
+            family = match.lastgroup
+            if family == "father":
+                father_counts[" ".join(match.group().split())] += 1
+            else:
+                family_counts[family] += 1
+
+        # Token scan: single-word vocabularies become set lookups over word counts
+        words = Counter(self.word_regex.findall(lowered))
 
-        # Count unique fathers
-        unique_fathers = sum(
-            1 for pattern in self.father_patterns
-            if re.search(pattern, full_text, re.IGNORECASE)
-        )
+        return {
+            "father_counts": father_counts,
+            "named_works": family_counts["work"],
+            "scripture_references": sum(1 for _ in self.scripture_regex.finditer(content)),
+            "orthodox_terms": sum(words[term] for term in self.orthodox_terms),
+            "orthodox_mentions": words["orthodox"],
+            "western_contrasts": family_counts["western"],
+            "lived_refs": sum(words[term] for term in self.lived_terms),
+            "cross_refs": family_counts["cross_ref"],
+            "has_patristic_term": family_counts["patristic"] > 0
+        }
 
-        # Count named works
-        named_works = sum(
-            len(re.findall(pattern, full_text, re.IGNORECASE))
-            for pattern in self.work_patterns
-        )
+    def _sum_features(self, features: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sum per-section features into entry-wide totals."""
+        totals: Dict[str, Any] = {
+            "father_counts": Counter(),
+            "named_works": 0,
+            "scripture_references": 0,
+            "orthodox_terms": 0,
+            "orthodox_mentions": 0,
+            "western_contrasts": 0,
+            "lived_refs": 0,
+            "cross_refs": 0
+        }
 
-        # Count Scripture references (simplified)
-        scripture_pattern = r'\b(Gen\.|Exod\.|Matt\.|John|Rom\.|Cor\.|Gal\.|Eph\.|Phil\.|Col\.|Heb\.|James|Pet\.|Rev\.)\s+\d+'
-        scripture_references = len(re.findall(scripture_pattern, full_text))
+        for f in features:
+            totals["father_counts"].update(f["father_counts"])
+            for key in ("named_works", "scripture_references", "orthodox_terms",
+                        "orthodox_mentions", "western_contrasts", "lived_refs", "cross_refs"):
+                totals[key] += f[key]
 
-        # Count Orthodox theological terms
-        orthodox_terms = len(re.findall(
-            r'\b(theosis|energies|essence|hypostasis|ousia|physis|perichoresis|'
-            r'apophatic|cataphatic|hesychasm|synergy|uncreated|nous|'
-            r'deification|transfiguration|icon|liturgy)\b',
-            full_text,
-            re.IGNORECASE
-        ))
+        return totals
+
+    def _collect_statistics(self, total_words: int, totals: Dict[str, Any]) -> Dict[str, int]:
+        """Collect entry statistics."""
+        father_counts = totals["father_counts"]
 
         return {
-            "total_words": entry.total_words,
-            "patristic_citations": patristic_citations,
-            "unique_fathers": unique_fathers,
-            "named_works": named_works,
-            "scripture_references": scripture_references,
-            "orthodox_terms": orthodox_terms
+            "total_words": total_words,
+            "patristic_citations": sum(father_counts.values()),
+            "unique_fathers": len(father_counts),
+            "named_works": totals["named_works"],
+            "scripture_references": totals["scripture_references"],
+            "orthodox_terms": totals["orthodox_terms"]
         }
 
-    def _count_cross_references(self, entry: Entry) -> int:
-        """Count cross-references between sections."""
-        # Look for phrases like "as discussed in", "as we saw", "building on", etc.
-        cross_ref_patterns = [
-            r'as\s+(discussed|mentioned|seen|noted|explored)\s+in',
-            r'building\s+on',
-            r'returning\s+to',
-            r'as\s+we\s+(saw|discussed|noted)',
-            r'earlier\s+discussion',
-            r'previous\s+section'
-        ]
-
-        full_text = " ".join(s.content for s in entry.sections)
-        count = sum(
-            len(re.findall(pattern, full_text, re.IGNORECASE))
-            for pattern in cross_ref_patterns
-        )
-
-        return count
-
     def _assess_transitions(self, entry: Entry) -> float:
         """Assess quality of transitions between sections (simplified)."""
         # This is a simplified heuristic
@@ -465,20 +689,7 @@ class EntryValidator:
 
     def _determine_tier(self, score: float) -> QualityTier:
         """Determine quality tier from score."""
-        if score >= 95:
-            return QualityTier.CELESTIAL
-        elif score >= 90:
-            return QualityTier.ADAMANTINE
-        elif score >= 85:
-            return QualityTier.PLATINUM
-        elif score >= 80:
-            return QualityTier.GOLD
-        elif score >= 75:
-            return QualityTier.SILVER
-        elif score >= 70:
-            return QualityTier.BRONZE
-        else:
-            return QualityTier.UNRANKED
+        return _TIERS[bisect.bisect_right(_TIER_THRESHOLDS, score)]
 
     def _generate_feedback(
         self,
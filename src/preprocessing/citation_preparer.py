@@ -8,33 +8,84 @@ Manages comprehensive database of verified Patristic citations including:
 - Citation formatting
 """
 
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+import functools
+from pathlib import Path
 import json
+import sys
 
 
-@dataclass
+# Verified works, keyed by Church Father
+PATRISTIC_DB_PATH = Path(__file__).parent / "data" / "patristic_db.json"
+
+
+def _theme_mask(themes_folded: Iterable[str], theme_bits: Dict[str, int]) -> int:
+    """Bitmask of the themes among themes_folded that have a bit in theme_bits"""
+    mask = 0
+    for theme in themes_folded:
+        mask |= theme_bits.get(theme, 0)
+    return mask
+
+
+@dataclass(slots=True, frozen=True)
 class PatristicWork:
     """Information about a Patristic work"""
     title: str
     author: str
-    alternate_titles: List[str]
+    alternate_titles: Tuple[str, ...]
     greek_latin_title: Optional[str]
-    themes: List[str]
-    key_passages: List[str]
+    themes: Tuple[str, ...]
+    key_passages: Tuple[str, ...]
     century: int
     verified: bool = True
+    _themes_folded: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Sequence fields are stored as tuples so instances stay hashable
+        for name in ('alternate_titles', 'themes', 'key_passages'):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        
+        # Normalized once here so theme scoring never re-folds case
+        themes_folded = tuple(sys.intern(t.casefold()) for t in self.themes)
+        object.__setattr__(self, '_themes_folded', themes_folded)
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PreparedCitation:
-    """A prepared citation ready for inclusion"""
+    """
+    A prepared citation ready for inclusion
+    
+    The citation format and suggested context are formatted from the raw
+    fields on first access, so candidates that are only ranked never pay
+    for string building.
+    """
     father: str
     work: str
     theme: str
-    suggested_context: str
-    citation_format: str
+    topic: str
     theological_relevance: float
+    _citation_format: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _suggested_context: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def citation_format(self) -> str:
+        """Citation as it should appear in the entry"""
+        if self._citation_format is None:
+            object.__setattr__(
+                self, '_citation_format', f"{self.father}, in *{self.work}*"
+            )
+        return self._citation_format
+    
+    @property
+    def suggested_context(self) -> str:
+        """Suggested framing for the citation"""
+        if self._suggested_context is None:
+            object.__setattr__(self, '_suggested_context', (
+                f"{self.father} addresses {self.theme} in {self.work}, "
+                f"providing patristic foundation for understanding {self.topic}"
+            ))
+        return self._suggested_context
     
 
 class CitationPreparer:
@@ -43,9 +94,37 @@ class CitationPreparer:
     Maintains database of verified works to prevent hallucination
     """
     
+    # Distinct prepare_citations requests remembered per preparer
+    CITATION_CACHE_SIZE = 1024
+    
+    # Database and lookup tables shared by every preparer in the process
+    _DB_CACHE: Optional[Dict[str, Tuple[PatristicWork, ...]]] = None
+    _THEME_INDEX_CACHE: Optional[Dict[str, List[Tuple[str, PatristicWork]]]] = None
+    _VERIFIED_PAIRS_CACHE: Optional[FrozenSet[Tuple[str, str]]] = None
+    _THEME_BITS_CACHE: Optional[Dict[str, int]] = None
+    _MASKED_WORKS_CACHE: Optional[Dict[str, Tuple[Tuple[int, PatristicWork], ...]]] = None
+    
     def __init__(self):
         """Initialize citation database"""
-        self.patristic_database = self._load_patristic_database()
+        cls = CitationPreparer
+        if cls._DB_CACHE is None:
+            database = self._load_patristic_database()
+            cls._THEME_INDEX_CACHE = self._build_theme_index(database)
+            cls._VERIFIED_PAIRS_CACHE = self._build_verified_pairs(database)
+            cls._THEME_BITS_CACHE = self._build_theme_bits(database)
+            cls._MASKED_WORKS_CACHE = self._build_masked_works(
+                database, cls._THEME_BITS_CACHE
+            )
+            cls._DB_CACHE = database
+        
+        self.patristic_database = cls._DB_CACHE
+        self._theme_index = cls._THEME_INDEX_CACHE
+        self._verified_pairs = cls._VERIFIED_PAIRS_CACHE
+        self._theme_bits = cls._THEME_BITS_CACHE
+        self._masked_works = cls._MASKED_WORKS_CACHE
+        self._prepare_cached = functools.lru_cache(
+            maxsize=self.CITATION_CACHE_SIZE
+        )(self._prepare_citations)
         
     def prepare_citations(
         self,
@@ -64,26 +143,80 @@ class CitationPreparer:
             count: Number of citations to prepare
             
         Returns:
-            List of prepared citations with verification
+            List of prepared citations with verification. Results are
+            memoized, so citations are shared between calls with the same
+            arguments and must not be modified.
+        """
+        return list(self._prepare_cached(
+            topic, tuple(suggested_fathers), tuple(themes), count
+        ))
+    
+    def prepare_citations_batch(
+        self,
+        requests: List[Tuple[str, List[str], List[str], int]]
+    ) -> List[List[PreparedCitation]]:
+        """
+        Prepare verified citations for many topics in one pass
+        
+        Args:
+            requests: (topic, suggested_fathers, themes, count) per topic
+            
+        Returns:
+            One list of prepared citations per request, in request order
         """
+        # Work rankings depend only on (father, themes), so topics sharing
+        # themes rank each father's works once for the whole batch
+        ranked: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[int, PatristicWork]]] = {}
+        
+        return [
+            list(self._prepare_citations(
+                topic, tuple(suggested_fathers), tuple(themes), count, ranked
+            ))
+            for topic, suggested_fathers, themes, count in requests
+        ]
+    
+    def _prepare_citations(
+        self,
+        topic: str,
+        suggested_fathers: Tuple[str, ...],
+        themes: Tuple[str, ...],
+        count: int,
+        ranked: Optional[Dict[Tuple[str, Tuple[str, ...]], List[Tuple[int, PatristicWork]]]] = None
+    ) -> Tuple[PreparedCitation, ...]:
+        """Uncached body of prepare_citations over hashable arguments"""
         prepared = []
+        if ranked is None:
+            ranked = {}
         
-        for father in suggested_fathers:
-            if father in self.patristic_database:
-                works = self.patristic_database[father]
-                
-                # Find relevant works for this topic
-                relevant_works = self._find_relevant_works(works, themes)
-                
-                for work in relevant_works[:min(3, len(relevant_works))]:
-                    citation = self._create_citation(father, work, topic, themes)
-                    if citation:
-                        prepared.append(citation)
-                        
-                    if len(prepared) >= count:
-                        return prepared
+        # Relevance is the share of distinct requested themes a work covers
+        theme_count = max(1, len({theme.casefold() for theme in themes}))
         
-        return prepared
+        # Repeated fathers are only cited once, in first-seen order
+        for father in dict.fromkeys(suggested_fathers):
+            masked_works = self._masked_works.get(father)
+            if masked_works is None:
+                continue
+            
+            # Find relevant works for this topic
+            relevant_works = ranked.get((father, themes))
+            if relevant_works is None:
+                relevant_works = self._find_relevant_works(
+                    masked_works, themes, limit=3
+                )
+                ranked[(father, themes)] = relevant_works
+            
+            for score, work in relevant_works[:min(3, len(relevant_works))]:
+                citation = self._create_citation(
+                    father, work, topic, themes,
+                    relevance=min(1.0, score / theme_count)
+                )
+                if citation:
+                    prepared.append(citation)
+                    
+                if len(prepared) >= count:
+                    return tuple(prepared)
+        
+        return tuple(prepared)
     
     def verify_citation(self, father: str, work_title: str) -> bool:
         """
@@ -96,80 +229,90 @@ class CitationPreparer:
         Returns:
             True if verified, False otherwise
         """
-        if father not in self.patristic_database:
-            return False
+        return (father, work_title.casefold()) in self._verified_pairs
+    
+    def batch_verify(self, pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+        """
+        Verify many citations in one call
         
-        works = self.patristic_database[father]
-        return any(
-            work.title == work_title or work_title in work.alternate_titles
-            for work in works
-        )
+        Args:
+            pairs: (father, work_title) per citation
+            
+        Returns:
+            One verification result per pair, in input order
+        """
+        verified_pairs = self._verified_pairs
+        return [
+            (father, work_title.casefold()) in verified_pairs
+            for father, work_title in pairs
+        ]
     
     def get_works_by_father(self, father: str) -> List[PatristicWork]:
         """Get all verified works by a Church Father"""
-        return self.patristic_database.get(father, [])
+        return list(self.patristic_database.get(father, ()))
     
     def get_works_by_theme(self, theme: str) -> List[Tuple[str, PatristicWork]]:
         """Get all works addressing a specific theme"""
-        results = []
-        
-        for father, works in self.patristic_database.items():
-            for work in works:
-                if theme.lower() in [t.lower() for t in work.themes]:
-                    results.append((father, work))
-        
-        return results
+        return list(self._theme_index.get(theme.casefold(), ()))
     
     def _find_relevant_works(
         self,
-        works: List[PatristicWork],
-        themes: List[str]
-    ) -> List[PatristicWork]:
-        """Find works relevant to specified themes"""
+        masked_works: Tuple[Tuple[int, PatristicWork], ...],
+        themes: List[str],
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, PatristicWork]]:
+        """
+        Find works relevant to specified themes, with their overlap scores
+        
+        masked_works pairs each work with its theme mask. With a limit, scanning stops once that many works match every
+        requested theme, since nothing later can outrank them.
+        """
+        # Score based on theme overlap: one point per requested theme the
+        # work carries
+        wanted = _theme_mask(
+            (theme.casefold() for theme in themes), self._theme_bits
+        )
+        best_score = wanted.bit_count()
         scored_works = []
+        perfect = 0
         
-        for work in works:
-            # Score based on theme overlap
-            score = sum(
-                1 for theme in themes
-                for work_theme in work.themes
-                if theme.lower() in work_theme.lower()
-            )
+        for mask, work in masked_works:
+            score = (wanted & mask).bit_count()
             if score > 0:
                 scored_works.append((score, work))
+                if score == best_score:
+                    perfect += 1
+                    if limit is not None and perfect >= limit:
+                        break
         
         # Sort by relevance
         scored_works.sort(key=lambda x: x[0], reverse=True)
         
-        return [work for score, work in scored_works]
+        return scored_works
     
     def _create_citation(
         self,
         father: str,
         work: PatristicWork,
         topic: str,
-        themes: List[str]
+        themes: List[str],
+        relevance: Optional[float] = None
     ) -> Optional[PreparedCitation]:
-        """Create a prepared citation"""
+        """Create a prepared citation, reusing a precomputed relevance if given"""
         
         # Find most relevant theme
         theme = themes[0] if themes else "Orthodox theology"
         
-        # Create citation format
-        citation_format = f"{father}, in *{work.title}*"
-        
         # Calculate theological relevance
-        relevance = self._calculate_relevance(work, themes)
-        
-        # Generate suggested context
-        context = self._generate_context(father, work, theme, topic)
+        if relevance is None:
+            relevance = self._calculate_relevance(work, themes)
         
+        # Citation format and context are formatted lazily by PreparedCitation
         return PreparedCitation(
             father=father,
             work=work.title,
             theme=theme,
-            suggested_context=context,
-            citation_format=citation_format,
+            topic=topic,
             theological_relevance=relevance
         )
     
@@ -178,240 +321,76 @@ class CitationPreparer:
         if not themes:
             return 0.5
         
-        overlap = sum(
-            1 for theme in themes
-            for work_theme in work.themes
-            if theme.lower() in work_theme.lower()
-        )
+        # Set intersection rather than masks, since the work need not come
+        # from the database whose themes have bits
+        wanted = frozenset(theme.casefold() for theme in themes)
+        overlap = len(wanted.intersection(work._themes_folded))
         
-        return min(1.0, overlap / len(themes))
+        return min(1.0, overlap / len(wanted))
     
-    def _generate_context(
-        self,
-        father: str,
-        work: PatristicWork,
-        theme: str,
-        topic: str
-    ) -> str:
-        """Generate suggested context for citation"""
-        return (
-            f"{father} addresses {theme} in {work.title}, "
-            f"providing patristic foundation for understanding {topic}"
+    @staticmethod
+    def _build_theme_index(
+        database: Dict[str, Tuple[PatristicWork, ...]]
+    ) -> Dict[str, List[Tuple[str, PatristicWork]]]:
+        """Invert the database into case-folded theme -> (father, work) pairs"""
+        index: Dict[str, List[Tuple[str, PatristicWork]]] = {}
+        
+        for father, works in database.items():
+            for work in works:
+                for work_theme in work._themes_folded:
+                    index.setdefault(work_theme, []).append((father, work))
+        
+        return index
+    
+    @staticmethod
+    def _build_theme_bits(
+        database: Dict[str, Tuple[PatristicWork, ...]]
+    ) -> Dict[str, int]:
+        """
+        Assign a bit to each case-folded theme in the database
+        
+        Theme overlap between a work and a request is then the popcount of
+        their masks ANDed together.
+        """
+        theme_bits: Dict[str, int] = {}
+        for works in database.values():
+            for work in works:
+                for theme in work._themes_folded:
+                    theme_bits.setdefault(theme, 1 << len(theme_bits))
+        return theme_bits
+    
+    @staticmethod
+    def _build_masked_works(
+        database: Dict[str, Tuple[PatristicWork, ...]],
+        theme_bits: Dict[str, int]
+    ) -> Dict[str, Tuple[Tuple[int, PatristicWork], ...]]:
+        """Pair every work with its theme mask, keyed by father"""
+        return {
+            father: tuple(
+                (_theme_mask(work._themes_folded, theme_bits), work)
+                for work in works
+            )
+            for father, works in database.items()
+        }
+    
+    @staticmethod
+    def _build_verified_pairs(
+        database: Dict[str, Tuple[PatristicWork, ...]]
+    ) -> FrozenSet[Tuple[str, str]]:
+        """Collect (father, case-folded title) for every title and alternate title"""
+        return frozenset(
+            (father, title.casefold())
+            for father, works in database.items()
+            for work in works
+            for title in (work.title, *work.alternate_titles)
         )
     
-    def _load_patristic_database(self) -> Dict[str, List[PatristicWork]]:
+    @classmethod
+    def _load_patristic_database(cls) -> Dict[str, Tuple[PatristicWork, ...]]:
         """Load comprehensive database of verified Patristic works"""
+        raw = json.loads(PATRISTIC_DB_PATH.read_text(encoding='utf-8'))
         
-        database = {
-            'St. Gregory of Nyssa': [
-                PatristicWork(
-                    title='On the Making of Man',
-                    author='St. Gregory of Nyssa',
-                    alternate_titles=['De Hominis Opificio'],
-                    greek_latin_title='De hominis opificio',
-                    themes=['Anthropology', 'Creation', 'Image of God', 'Soul', 'Body'],
-                    key_passages=['On the dual nature of humanity', 'Image and likeness distinction'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='The Life of Moses',
-                    author='St. Gregory of Nyssa',
-                    alternate_titles=['De Vita Moysis'],
-                    greek_latin_title='De vita Moysis',
-                    themes=['Theosis', 'Spiritual ascent', 'Apophatic theology', 'Mysticism'],
-                    key_passages=['The darkness of unknowing', 'Perpetual progress'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Against Eunomius',
-                    author='St. Gregory of Nyssa',
-                    alternate_titles=['Contra Eunomium'],
-                    greek_latin_title='Contra Eunomium',
-                    themes=['Trinity', 'Divine nature', 'Theology proper', 'Heresy refutation'],
-                    key_passages=['Divine simplicity', 'Trinitarian relations'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='On the Soul and Resurrection',
-                    author='St. Gregory of Nyssa',
-                    alternate_titles=['De Anima et Resurrectione'],
-                    greek_latin_title='De anima et resurrectione',
-                    themes=['Eschatology', 'Soul', 'Resurrection', 'Immortality'],
-                    key_passages=['Nature of the soul', 'Resurrection of the body'],
-                    century=4
-                ),
-            ],
-            
-            'St. Maximus the Confessor': [
-                PatristicWork(
-                    title='Ambigua',
-                    author='St. Maximus the Confessor',
-                    alternate_titles=['Difficulties', 'Ambiguum'],
-                    greek_latin_title='Ambigua',
-                    themes=['Christology', 'Cosmology', 'Theosis', 'Logos', 'Creation'],
-                    key_passages=['Logoi doctrine', 'Cosmic liturgy'],
-                    century=7
-                ),
-                PatristicWork(
-                    title='Chapters on Charity',
-                    author='St. Maximus the Confessor',
-                    alternate_titles=['Four Hundred Chapters on Love', 'Centuriae de charitate'],
-                    greek_latin_title='Capita de caritate',
-                    themes=['Love', 'Virtue', 'Spiritual life', 'Asceticism'],
-                    key_passages=['Divine love', 'Passions and virtues'],
-                    century=7
-                ),
-                PatristicWork(
-                    title='Mystagogy',
-                    author='St. Maximus the Confessor',
-                    alternate_titles=['The Church\'s Mystagogy'],
-                    greek_latin_title='Mystagogia',
-                    themes=['Liturgy', 'Church', 'Sacraments', 'Symbolism'],
-                    key_passages=['Liturgical symbolism', 'Church as image of cosmos'],
-                    century=7
-                ),
-                PatristicWork(
-                    title='Opuscula',
-                    author='St. Maximus the Confessor',
-                    alternate_titles=['Theological and Polemical Opuscula'],
-                    greek_latin_title='Opuscula theologica et polemica',
-                    themes=['Christology', 'Will of Christ', 'Monothelitism', 'Trinity'],
-                    key_passages=['Two wills of Christ', 'Dyothelitism'],
-                    century=7
-                ),
-            ],
-            
-            'St. Basil the Great': [
-                PatristicWork(
-                    title='On the Holy Spirit',
-                    author='St. Basil the Great',
-                    alternate_titles=['De Spiritu Sancto'],
-                    greek_latin_title='De Spiritu Sancto',
-                    themes=['Pneumatology', 'Trinity', 'Holy Spirit', 'Theology proper'],
-                    key_passages=['Divinity of the Spirit', 'Trinitarian theology'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Hexaemeron',
-                    author='St. Basil the Great',
-                    alternate_titles=['The Six Days of Creation'],
-                    greek_latin_title='Hexaemeron',
-                    themes=['Creation', 'Cosmology', 'Nature', 'Science and faith'],
-                    key_passages=['Days of creation', 'Divine wisdom in nature'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Against Eunomius',
-                    author='St. Basil the Great',
-                    alternate_titles=['Contra Eunomium'],
-                    greek_latin_title='Adversus Eunomium',
-                    themes=['Trinity', 'Divine nature', 'Heresy refutation'],
-                    key_passages=['Divine simplicity', 'Son equal to Father'],
-                    century=4
-                ),
-            ],
-            
-            'St. John Chrysostom': [
-                PatristicWork(
-                    title='Homilies on the Gospel of John',
-                    author='St. John Chrysostom',
-                    alternate_titles=['Homiliae in Joannem'],
-                    greek_latin_title='In Johannem homiliae',
-                    themes=['Christology', 'Scripture', 'Pastoral theology', 'Exegesis'],
-                    key_passages=['Divinity of Christ', 'Incarnation'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='On the Priesthood',
-                    author='St. John Chrysostom',
-                    alternate_titles=['De Sacerdotio'],
-                    greek_latin_title='De sacerdotio',
-                    themes=['Priesthood', 'Ministry', 'Church', 'Pastoral care'],
-                    key_passages=['Dignity of priesthood', 'Pastoral responsibility'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Homilies on Matthew',
-                    author='St. John Chrysostom',
-                    alternate_titles=['Homiliae in Matthaeum'],
-                    greek_latin_title='In Matthaeum homiliae',
-                    themes=['Scripture', 'Ethics', 'Christian life', 'Exegesis'],
-                    key_passages=['Sermon on the Mount', 'Christian virtue'],
-                    century=4
-                ),
-            ],
-            
-            'St. Athanasius': [
-                PatristicWork(
-                    title='On the Incarnation',
-                    author='St. Athanasius',
-                    alternate_titles=['De Incarnatione'],
-                    greek_latin_title='De incarnatione Verbi',
-                    themes=['Christology', 'Incarnation', 'Soteriology', 'Theosis'],
-                    key_passages=['God became man that man might become god', 'Salvation through Incarnation'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Against the Heathen',
-                    author='St. Athanasius',
-                    alternate_titles=['Contra Gentes'],
-                    greek_latin_title='Oratio contra gentes',
-                    themes=['Apologetics', 'Philosophy', 'Idolatry', 'Creation'],
-                    key_passages=['Against paganism', 'True knowledge of God'],
-                    century=4
-                ),
-                PatristicWork(
-                    title='Letters to Serapion',
-                    author='St. Athanasius',
-                    alternate_titles=['Epistulae ad Serapionem'],
-                    greek_latin_title='Epistolae ad Serapionem',
-                    themes=['Pneumatology', 'Trinity', 'Holy Spirit'],
-                    key_passages=['Divinity of the Holy Spirit', 'Trinitarian theology'],
-                    century=4
-                ),
-            ],
-            
-            'St. Gregory Palamas': [
-                PatristicWork(
-                    title='Triads in Defense of the Holy Hesychasts',
-                    author='St. Gregory Palamas',
-                    alternate_titles=['The Triads'],
-                    greek_latin_title='Triades',
-                    themes=['Hesychasm', 'Divine energies', 'Essence-energies', 'Mysticism', 'Prayer'],
-                    key_passages=['Essence-energies distinction', 'Uncreated light'],
-                    century=14
-                ),
-                PatristicWork(
-                    title='One Hundred and Fifty Chapters',
-                    author='St. Gregory Palamas',
-                    alternate_titles=['Physical, Theological, Moral, and Practical Chapters'],
-                    greek_latin_title='Capita CL',
-                    themes=['Theology', 'Philosophy', 'Asceticism', 'Divine energies'],
-                    key_passages=['Natural contemplation', 'Theosis through energies'],
-                    century=14
-                ),
-            ],
-            
-            'St. John of Damascus': [
-                PatristicWork(
-                    title='Exact Exposition of the Orthodox Faith',
-                    author='St. John of Damascus',
-                    alternate_titles=['De Fide Orthodoxa'],
-                    greek_latin_title='Expositio fidei orthodoxae',
-                    themes=['Systematic theology', 'Trinity', 'Christology', 'Anthropology'],
-                    key_passages=['Systematic exposition', 'Orthodox doctrine'],
-                    century=8
-                ),
-                PatristicWork(
-                    title='On the Divine Images',
-                    author='St. John of Damascus',
-                    alternate_titles=['De Imaginibus'],
-                    greek_latin_title='Orationes de imaginibus',
-                    themes=['Iconography', 'Incarnation', 'Matter', 'Worship'],
-                    key_passages=['Defense of icons', 'Incarnation and matter'],
-                    century=8
-                ),
-            ],
+        return {
+            father: tuple(PatristicWork(**work) for work in works)
+            for father, works in raw.items()
         }
-        
-        return database
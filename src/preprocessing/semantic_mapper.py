@@ -8,18 +8,34 @@ Creates semantic maps of theological concepts showing:
 - Contemporary relevance
 """
 
-from typing import Dict, List, Set, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from types import MappingProxyType
+import functools
+import sys
 
 
-class TheologicalRelationType(Enum):
+def _canon(concept: str) -> str:
+    """Interned form of a concept name, so table lookups compare by identity"""
+    return sys.intern(concept)
+
+
+def _intern_concepts(table: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Intern the concept keys and names of a doctrinal table"""
+    return {
+        _canon(concept): tuple(_canon(name) for name in names)
+        for concept, names in table.items()
+    }
+
+
+class TheologicalRelationType(IntEnum):
     """Types of relationships between theological concepts"""
-    FOUNDATION = "foundation"  # One concept foundational to another
-    DEVELOPMENT = "development"  # Historical development relationship
-    CONTRAST = "contrast"  # Dialectical opposition
-    SYNTHESIS = "synthesis"  # Synthetic integration
-    APPLICATION = "application"  # Practical application
+    FOUNDATION = 1  # One concept foundational to another
+    DEVELOPMENT = 2  # Historical development relationship
+    CONTRAST = 3  # Dialectical opposition
+    SYNTHESIS = 4  # Synthetic integration
+    APPLICATION = 5  # Practical application
     
 
 @dataclass
@@ -29,7 +45,7 @@ class SemanticRelation:
     concept_to: str
     relation_type: TheologicalRelationType
     strength: float  # 0.0-1.0
-    patristic_support: List[str]
+    patristic_support: Tuple[str, ...]
     
     
 @dataclass
@@ -50,36 +66,53 @@ class SemanticMapper:
     """
     
     # Core Orthodox doctrinal relationships
-    DOCTRINAL_FOUNDATIONS = {
-        'Theosis': ['Trinity', 'Incarnation', 'Divine Energies'],
-        'Incarnation': ['Trinity', 'Christology'],
-        'Divine Energies': ['Trinity', 'Essence-Energies distinction'],
-        'Sacramental life': ['Incarnation', 'Ecclesiology', 'Liturgical theology'],
-        'Iconography': ['Incarnation', 'Christology', 'Theology of matter'],
-        'Hesychasm': ['Divine Energies', 'Apophatic theology', 'Prayer'],
-    }
+    DOCTRINAL_FOUNDATIONS = MappingProxyType(_intern_concepts({
+        'Theosis': ('Trinity', 'Incarnation', 'Divine Energies'),
+        'Incarnation': ('Trinity', 'Christology'),
+        'Divine Energies': ('Trinity', 'Essence-Energies distinction'),
+        'Sacramental life': ('Incarnation', 'Ecclesiology', 'Liturgical theology'),
+        'Iconography': ('Incarnation', 'Christology', 'Theology of matter'),
+        'Hesychasm': ('Divine Energies', 'Apophatic theology', 'Prayer'),
+    }))
     
     # Western contrasts
-    WESTERN_CONTRASTS = {
+    WESTERN_CONTRASTS = MappingProxyType(_intern_concepts({
         'Theosis': ('Justification (forensic)', 'Orthodox emphasizes transformation, West emphasizes legal status'),
         'Divine Energies': ('Created grace', 'Orthodox affirms uncreated energies, West posits created grace'),
         'Essence-Energies': ('Divine Simplicity (absolute)', 'Orthodox maintains real distinction, West absolute simplicity'),
         'Synergy': ('Sola gratia', 'Orthodox affirms cooperation, West emphasizes grace alone'),
         'Apophatic theology': ('Scholastic systematization', 'Orthodox maintains mystery, West systematizes'),
-    }
+    }))
     
     # Liturgical connections
-    LITURGICAL_CONNECTIONS = {
-        'Theosis': ['Divine Liturgy', 'Eucharist', 'Baptism', 'Chrismation'],
-        'Incarnation': ['Nativity', 'Theophany', 'Transfiguration', 'Eucharist'],
-        'Trinity': ['Divine Liturgy', 'Baptismal formula', 'Doxologies'],
-        'Resurrection': ['Pascha', 'Divine Liturgy', 'Baptism'],
-        'Pneumatology': ['Pentecost', 'Epiclesis', 'Chrismation'],
-    }
+    LITURGICAL_CONNECTIONS = MappingProxyType(_intern_concepts({
+        'Theosis': ('Divine Liturgy', 'Eucharist', 'Baptism', 'Chrismation'),
+        'Incarnation': ('Nativity', 'Theophany', 'Transfiguration', 'Eucharist'),
+        'Trinity': ('Divine Liturgy', 'Baptismal formula', 'Doxologies'),
+        'Resurrection': ('Pascha', 'Divine Liturgy', 'Baptism'),
+        'Pneumatology': ('Pentecost', 'Epiclesis', 'Chrismation'),
+    }))
+    
+    # Historical development paths and their strength
+    DEVELOPMENT_PATHS = MappingProxyType({
+        ('Trinity', 'Theosis'): 0.8,
+        ('Incarnation', 'Iconography'): 0.9,
+        ('Divine Energies', 'Hesychasm'): 0.85,
+    })
+    
+    # Distinct central concepts whose semantic maps are remembered
+    MAP_CACHE_SIZE = 256
     
     def __init__(self):
         """Initialize semantic mapper"""
         self.concept_graph = self._build_concept_graph()
+        self._reverse_foundations = self._build_reverse_foundations()
+        self._developments_by_source = self._build_developments_by_source()
+        self._support_cache = self._build_support_cache()
+        self._precompute_concept_closures()
+        self._map_cached = functools.lru_cache(
+            maxsize=self.MAP_CACHE_SIZE
+        )(self._build_map)
         
     def map_topic(self, topic: str, core_themes: List[str]) -> SemanticMap:
         """
@@ -93,8 +126,25 @@ class SemanticMapper:
             SemanticMap with complete relationship network
         """
         # Extract central concept
-        central_concept = self._extract_central_concept(topic, core_themes)
-        
+        central_concept = _canon(self._extract_central_concept(topic, core_themes))
+        semantic_map = self._map_cached(central_concept)
+        
+        # Maps are memoized per central concept; hand out fresh containers
+        # so callers can edit a map without touching the cached copy
+        return replace(
+            semantic_map,
+            related_concepts=list(semantic_map.related_concepts),
+            relations=[replace(relation) for relation in semantic_map.relations],
+            doctrinal_layers={
+                layer: list(concepts)
+                for layer, concepts in semantic_map.doctrinal_layers.items()
+            },
+            western_contrasts=list(semantic_map.western_contrasts),
+            liturgical_connections=list(semantic_map.liturgical_connections)
+        )
+    
+    def _build_map(self, central_concept: str) -> SemanticMap:
+        """Build the semantic map around a central concept"""
         # Find related concepts
         related_concepts = self._find_related_concepts(central_concept)
         
@@ -108,7 +158,7 @@ class SemanticMapper:
         western_contrasts = self._find_western_contrasts(central_concept, related_concepts)
         
         # Map liturgical connections
-        liturgical_connections = self._map_liturgical_connections(central_concept, related_concepts)
+        liturgical_connections = self._map_liturgical_connections(central_concept)
         
         return SemanticMap(
             central_concept=central_concept,
@@ -142,6 +192,10 @@ class SemanticMapper:
     
     def _find_related_concepts(self, central_concept: str) -> List[str]:
         """Find concepts related to central concept"""
+        return list(self._related_cache.get(central_concept, self._default_related))
+    
+    def _collect_related_concepts(self, central_concept: Optional[str]) -> Tuple[str, ...]:
+        """Gather the sorted related concepts of a central concept"""
         related = set()
         
         # Foundational relationships
@@ -149,14 +203,12 @@ class SemanticMapper:
             related.update(self.DOCTRINAL_FOUNDATIONS[central_concept])
         
         # Reverse lookup - what concepts depend on this one
-        for concept, foundations in self.DOCTRINAL_FOUNDATIONS.items():
-            if central_concept in foundations:
-                related.add(concept)
+        related.update(self._reverse_foundations.get(central_concept, ()))
         
         # Always include core Orthodox doctrines
         related.update(['Trinity', 'Incarnation'])
         
-        return sorted(list(related))
+        return tuple(sorted(related))
     
     def _map_relations(self, central: str, related: List[str]) -> List[SemanticRelation]:
         """Map relationships between concepts"""
@@ -175,20 +227,14 @@ class SemanticMapper:
                     ))
         
         # Development relationships
-        development_paths = {
-            ('Trinity', 'Theosis'): 0.8,
-            ('Incarnation', 'Iconography'): 0.9,
-            ('Divine Energies', 'Hesychasm'): 0.85,
-        }
-        
-        for (from_c, to_c), strength in development_paths.items():
-            if from_c == central and to_c in related:
+        for to_c, strength in self._developments_by_source.get(central, ()):
+            if to_c in related:
                 relations.append(SemanticRelation(
-                    concept_from=from_c,
+                    concept_from=central,
                     concept_to=to_c,
                     relation_type=TheologicalRelationType.DEVELOPMENT,
                     strength=strength,
-                    patristic_support=self._get_patristic_support(from_c, to_c)
+                    patristic_support=self._get_patristic_support(central, to_c)
                 ))
         
         return relations
@@ -203,16 +249,16 @@ class SemanticMapper:
         }
         
         if central_concept in self.DOCTRINAL_FOUNDATIONS:
-            layers['essential'] = self.DOCTRINAL_FOUNDATIONS[central_concept]
+            layers['essential'] = list(self.DOCTRINAL_FOUNDATIONS[central_concept])
         
         # Find what develops from this concept
-        for concept, foundations in self.DOCTRINAL_FOUNDATIONS.items():
-            if central_concept in foundations:
-                layers['developmental'].append(concept)
+        layers['developmental'].extend(
+            self._reverse_foundations.get(central_concept, ())
+        )
         
         # Liturgical applications
         if central_concept in self.LITURGICAL_CONNECTIONS:
-            layers['applied'] = self.LITURGICAL_CONNECTIONS[central_concept]
+            layers['applied'] = list(self.LITURGICAL_CONNECTIONS[central_concept])
         
         return layers
     
@@ -231,8 +277,16 @@ class SemanticMapper:
         
         return contrasts
     
-    def _map_liturgical_connections(self, central: str, related: List[str]) -> List[str]:
+    def _map_liturgical_connections(self, central: str) -> List[str]:
         """Map connections to liturgical life"""
+        return list(self._liturgical_cache.get(central, self._default_liturgical))
+    
+    def _collect_liturgical_connections(
+        self,
+        central: Optional[str],
+        related: Tuple[str, ...]
+    ) -> Tuple[str, ...]:
+        """Gather the sorted liturgical connections of a concept and its relations"""
         connections = set()
         
         if central in self.LITURGICAL_CONNECTIONS:
@@ -245,10 +299,17 @@ class SemanticMapper:
         # Always include Divine Liturgy as central
         connections.add('Divine Liturgy')
         
-        return sorted(list(connections))
+        return tuple(sorted(connections))
     
-    def _get_patristic_support(self, from_concept: str, to_concept: str) -> List[str]:
+    def _get_patristic_support(self, from_concept: str, to_concept: str) -> Tuple[str, ...]:
         """Get Church Fathers who support this relationship"""
+        support = self._support_cache.get((from_concept, to_concept))
+        if support is None:
+            support = self._collect_patristic_support(from_concept, to_concept)
+        return support
+    
+    def _collect_patristic_support(self, from_concept: str, to_concept: str) -> Tuple[str, ...]:
+        """Work out the Church Fathers who support a relationship"""
         # This would ideally query a database
         # For now, return relevant fathers
         support = ['St. Maximus the Confessor', 'St. Gregory of Nyssa']
@@ -260,7 +321,63 @@ class SemanticMapper:
         if 'Energies' in from_concept or 'Energies' in to_concept:
             support.append('St. Gregory Palamas')
             
-        return support
+        return tuple(support)
+    
+    def _build_support_cache(self) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+        """Precompute patristic support for every relation _map_relations can emit"""
+        pairs = [
+            (foundation, concept)
+            for concept, foundations in self.DOCTRINAL_FOUNDATIONS.items()
+            for foundation in foundations
+        ]
+        pairs.extend(self.DEVELOPMENT_PATHS)
+        
+        return {
+            (_canon(from_c), _canon(to_c)): self._collect_patristic_support(from_c, to_c)
+            for from_c, to_c in pairs
+        }
+    
+    def _build_reverse_foundations(self) -> Dict[str, List[str]]:
+        """Map each foundation to the concepts that build on it"""
+        reverse: Dict[str, List[str]] = {}
+        
+        for concept, foundations in self.DOCTRINAL_FOUNDATIONS.items():
+            for foundation in foundations:
+                reverse.setdefault(foundation, []).append(concept)
+        
+        return reverse
+    
+    def _build_developments_by_source(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Group development paths by the concept they start from"""
+        by_source: Dict[str, List[Tuple[str, float]]] = {}
+        
+        for (from_c, to_c), strength in self.DEVELOPMENT_PATHS.items():
+            by_source.setdefault(_canon(from_c), []).append((_canon(to_c), strength))
+        
+        return by_source
+    
+    def _precompute_concept_closures(self):
+        """Precompute related concepts and liturgical connections per concept"""
+        known = (
+            set(self.DOCTRINAL_FOUNDATIONS)
+            | set(self._reverse_foundations)
+            | set(self.LITURGICAL_CONNECTIONS)
+        )
+        
+        self._related_cache: Dict[str, Tuple[str, ...]] = {}
+        self._liturgical_cache: Dict[str, Tuple[str, ...]] = {}
+        for concept in known:
+            related = self._collect_related_concepts(concept)
+            self._related_cache[concept] = related
+            self._liturgical_cache[concept] = self._collect_liturgical_connections(
+                concept, related
+            )
+        
+        # Concepts outside the known vocabulary all share the same closures
+        self._default_related = self._collect_related_concepts(None)
+        self._default_liturgical = self._collect_liturgical_connections(
+            None, self._default_related
+        )
     
     def _build_concept_graph(self) -> Dict:
         """Build complete concept relationship graph"""
@@ -10,25 +10,134 @@ Builds rich theological context for generation including:
 """
 
 from typing import Dict, List, Optional
-from dataclasses import dataclass
-from .topic_analyzer import TopicAnalysis
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from .topic_analyzer import TopicAnalysis, topic_tokens
 from .semantic_mapper import SemanticMap
 from .citation_preparer import PreparedCitation
 
 
-@dataclass
+# Century in which each Church Father lived
+_FATHER_CENTURIES = MappingProxyType({
+    'St. Gregory of Nyssa': '4th',
+    'St. Maximus the Confessor': '7th',
+    'St. Basil the Great': '4th',
+    'St. John Chrysostom': '4th-5th',
+    'St. Athanasius': '4th',
+    'St. Gregory Palamas': '14th',
+    'St. John of Damascus': '8th',
+    'St. Gregory Nazianzen': '4th',
+    'St. Ignatius of Antioch': '1st-2nd',
+    'St. Irenaeus of Lyons': '2nd',
+    'St. Cyril of Alexandria': '5th',
+})
+
+# Historical development patterns by theological domain
+_HISTORICAL_PATTERNS = MappingProxyType({
+    'trinitarian': 'Developed through 4th century Cappadocian synthesis',
+    'christological': 'Clarified through Ecumenical Councils 4th-7th centuries',
+    'hesychast': 'Synthesized by Gregory Palamas in 14th century',
+})
+
+# Topic words signalling each kind of contemporary relevance. Derived forms
+# are listed explicitly; stem matching would let 'ai' hit "aim" or "air"
+_SCIENCE_MARKERS = frozenset({
+    'science', 'scientific', 'quantum', 'physics', 'mathematics',
+})
+_TECH_MARKERS = frozenset({
+    'technology', 'technologies', 'technological', 'digital', 'ai', 'artificial',
+})
+_ECO_MARKERS = frozenset({
+    'ecology', 'ecological', 'environment', 'environmental', 'creation',
+})
+_PERSON_MARKERS = frozenset({
+    'person', 'personal', 'personhood', 'consciousness', 'mind', 'mindfulness',
+})
+
+# Narrative line for liturgical connections with dedicated wording
+_LITURGICAL_TEMPLATES = MappingProxyType({
+    'Divine Liturgy': "- Central to the Divine Liturgy, the Church's primary worship",
+    'Eucharist': "- Expressed in the Eucharistic celebration",
+    'Baptism': "- Connected to Baptismal theology and practice",
+    'Pascha': "- Celebrated especially during Pascha (Easter)",
+})
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class TheologicalContext:
-    """Complete theological context for entry generation"""
+    """
+    Complete theological context for entry generation
+    
+    The narratives, contrasts and section guidance are built by the
+    builder on first access and then kept, so consumers that read only
+    some of them never pay for the rest. They reflect the analysis and
+    semantic map as they stand at that first access.
+    """
     topic: str
     analysis: TopicAnalysis
     semantic_map: SemanticMap
     prepared_citations: List[PreparedCitation]
-    historical_development: str
-    contemporary_relevance: str
-    liturgical_context: str
-    scriptural_foundation: str
-    western_contrasts: List[str]
-    generation_guidance: Dict[str, str]
+    builder: 'TheologicalContextBuilder'
+    _historical_development: Optional[str] = field(default=None, init=False)
+    _contemporary_relevance: Optional[str] = field(default=None, init=False)
+    _liturgical_context: Optional[str] = field(default=None, init=False)
+    _scriptural_foundation: Optional[str] = field(default=None, init=False)
+    _western_contrasts: Optional[List[str]] = field(default=None, init=False)
+    _generation_guidance: Optional[Dict[str, str]] = field(default=None, init=False)
+    
+    @property
+    def historical_development(self) -> str:
+        """Historical development narrative"""
+        if self._historical_development is None:
+            self._historical_development = self.builder._build_historical_development(
+                self.topic, self.analysis, self.semantic_map
+            )
+        return self._historical_development
+    
+    @property
+    def contemporary_relevance(self) -> str:
+        """Contemporary relevance narrative"""
+        if self._contemporary_relevance is None:
+            self._contemporary_relevance = self.builder._identify_contemporary_relevance(
+                self.topic, self.analysis
+            )
+        return self._contemporary_relevance
+    
+    @property
+    def liturgical_context(self) -> str:
+        """Liturgical connections narrative"""
+        if self._liturgical_context is None:
+            self._liturgical_context = self.builder._build_liturgical_context(
+                self.semantic_map.liturgical_connections
+            )
+        return self._liturgical_context
+    
+    @property
+    def scriptural_foundation(self) -> str:
+        """Scriptural foundation narrative"""
+        if self._scriptural_foundation is None:
+            self._scriptural_foundation = self.builder._build_scriptural_foundation(
+                self.analysis.suggested_scriptures
+            )
+        return self._scriptural_foundation
+    
+    @property
+    def western_contrasts(self) -> List[str]:
+        """Formatted Western theological contrasts"""
+        if self._western_contrasts is None:
+            self._western_contrasts = self.builder._format_western_contrasts(
+                self.semantic_map.western_contrasts
+            )
+        return self._western_contrasts
+    
+    @property
+    def generation_guidance(self) -> Dict[str, str]:
+        """Guidance for each entry section"""
+        if self._generation_guidance is None:
+            self._generation_guidance = self.builder._generate_section_guidance(
+                self.topic, self.analysis, self.semantic_map
+            )
+        return self._generation_guidance
     
 
 class TheologicalContextBuilder:
@@ -37,9 +146,11 @@ class TheologicalContextBuilder:
     high-quality entry generation
     """
     
+    __slots__ = ('historical_patterns',)
+    
     def __init__(self):
         """Initialize context builder"""
-        self.historical_patterns = self._load_historical_patterns()
+        self.historical_patterns = _HISTORICAL_PATTERNS
         
     def build_context(
         self,
@@ -60,47 +171,13 @@ class TheologicalContextBuilder:
         Returns:
             Complete TheologicalContext for generation
         """
-        # Build historical development narrative
-        historical = self._build_historical_development(
-            topic, analysis, semantic_map
-        )
-        
-        # Identify contemporary relevance
-        contemporary = self._identify_contemporary_relevance(
-            topic, analysis
-        )
-        
-        # Build liturgical context
-        liturgical = self._build_liturgical_context(
-            semantic_map.liturgical_connections
-        )
-        
-        # Build scriptural foundation
-        scriptural = self._build_scriptural_foundation(
-            analysis.suggested_scriptures
-        )
-        
-        # Format Western contrasts
-        western = self._format_western_contrasts(
-            semantic_map.western_contrasts
-        )
-        
-        # Generate guidance for each section
-        guidance = self._generate_section_guidance(
-            topic, analysis, semantic_map
-        )
-        
+        # Narratives, contrasts and guidance are built on first access
         return TheologicalContext(
             topic=topic,
             analysis=analysis,
             semantic_map=semantic_map,
             prepared_citations=prepared_citations,
-            historical_development=historical,
-            contemporary_relevance=contemporary,
-            liturgical_context=liturgical,
-            scriptural_foundation=scriptural,
-            western_contrasts=western,
-            generation_guidance=guidance
+            builder=self
         )
     
     def _build_historical_development(
@@ -111,28 +188,32 @@ class TheologicalContextBuilder:
     ) -> str:
         """Build narrative of historical development"""
         
-        development = f"Historical Development of {topic}:\n\n"
+        parts = [f"Historical Development of {topic}:", ""]
         
         # Foundational layer
         if semantic_map.doctrinal_layers.get('foundational'):
             foundations = semantic_map.doctrinal_layers['foundational']
-            development += f"Foundational doctrines: {', '.join(foundations)}\n"
-            development += "These core teachings were established in the early centuries.\n\n"
+            parts.append(f"Foundational doctrines: {', '.join(foundations)}")
+            parts.append("These core teachings were established in the early centuries.")
+            parts.append("")
         
         # Development through Church Fathers
         fathers = analysis.suggested_fathers
         if fathers:
-            development += "Key Patristic developments:\n"
+            parts.append("Key Patristic developments:")
             for father in fathers[:5]:  # Top 5
-                century = self._get_father_century(father)
-                development += f"- {father} ({century} century)\n"
-            development += "\n"
+                century = _FATHER_CENTURIES.get(father, 'early')
+                parts.append(f"- {father} ({century} century)")
+            parts.append("")
         
         # Contemporary synthesis
-        development += "Modern Orthodox synthesis maintains patristic foundations "
-        development += "while addressing contemporary questions.\n"
+        parts.append(
+            "Modern Orthodox synthesis maintains patristic foundations "
+            "while addressing contemporary questions."
+        )
+        parts.append("")
         
-        return development
+        return "\n".join(parts)
     
     def _identify_contemporary_relevance(
         self,
@@ -141,28 +222,29 @@ class TheologicalContextBuilder:
     ) -> str:
         """Identify contemporary relevance of topic"""
         
-        relevance = f"Contemporary Relevance of {topic}:\n\n"
+        parts = [f"Contemporary Relevance of {topic}:", ""]
         
         # Check for contemporary markers in topic
-        topic_lower = topic.lower()
+        tokens = topic_tokens(topic.lower())
         
-        if any(term in topic_lower for term in ['science', 'quantum', 'physics', 'mathematics']):
-            relevance += "- Addresses relationship between Orthodox theology and modern science\n"
+        if _SCIENCE_MARKERS & tokens:
+            parts.append("- Addresses relationship between Orthodox theology and modern science")
         
-        if any(term in topic_lower for term in ['technology', 'digital', 'ai', 'artificial']):
-            relevance += "- Engages with technological developments from Orthodox perspective\n"
+        if _TECH_MARKERS & tokens:
+            parts.append("- Engages with technological developments from Orthodox perspective")
         
-        if any(term in topic_lower for term in ['ecology', 'environment', 'creation']):
-            relevance += "- Provides Orthodox response to ecological concerns\n"
+        if _ECO_MARKERS & tokens:
+            parts.append("- Provides Orthodox response to ecological concerns")
         
-        if any(term in topic_lower for term in ['person', 'consciousness', 'mind']):
-            relevance += "- Offers Orthodox anthropology for contemporary questions\n"
+        if _PERSON_MARKERS & tokens:
+            parts.append("- Offers Orthodox anthropology for contemporary questions")
         
         # Always add general relevance
-        relevance += "- Maintains living Patristic tradition in modern context\n"
-        relevance += "- Addresses perennial theological questions with Orthodox wisdom\n"
+        parts.append("- Maintains living Patristic tradition in modern context")
+        parts.append("- Addresses perennial theological questions with Orthodox wisdom")
+        parts.append("")
         
-        return relevance
+        return "\n".join(parts)
     
     def _build_liturgical_context(
         self,
@@ -173,23 +255,18 @@ class TheologicalContextBuilder:
         if not connections:
             return "This topic connects to the Divine Liturgy and sacramental life of the Church.\n"
         
-        context = "Liturgical Connections:\n\n"
+        parts = ["Liturgical Connections:", ""]
         
         for connection in connections:
-            if connection == 'Divine Liturgy':
-                context += "- Central to the Divine Liturgy, the Church's primary worship\n"
-            elif connection == 'Eucharist':
-                context += "- Expressed in the Eucharistic celebration\n"
-            elif connection == 'Baptism':
-                context += "- Connected to Baptismal theology and practice\n"
-            elif connection == 'Pascha':
-                context += "- Celebrated especially during Pascha (Easter)\n"
-            else:
-                context += f"- Manifested in {connection}\n"
+            parts.append(
+                _LITURGICAL_TEMPLATES.get(connection, f"- Manifested in {connection}")
+            )
         
-        context += "\nThe liturgical life embodies this theological truth.\n"
+        parts.append("")
+        parts.append("The liturgical life embodies this theological truth.")
+        parts.append("")
         
-        return context
+        return "\n".join(parts)
     
     def _build_scriptural_foundation(
         self,
@@ -200,16 +277,19 @@ class TheologicalContextBuilder:
         if not scriptures:
             return "Grounded in Scripture as interpreted by the Church Fathers.\n"
         
-        foundation = "Scriptural Foundation:\n\n"
-        foundation += "Key passages:\n"
+        parts = ["Scriptural Foundation:", "", "Key passages:"]
         
         for scripture in scriptures[:8]:  # Limit to top 8
-            foundation += f"- {scripture}\n"
+            parts.append(f"- {scripture}")
         
-        foundation += "\nThese passages, understood through Patristic exegesis, "
-        foundation += "provide biblical foundation for this teaching.\n"
+        parts.append("")
+        parts.append(
+            "These passages, understood through Patristic exegesis, "
+            "provide biblical foundation for this teaching."
+        )
+        parts.append("")
         
-        return foundation
+        return "\n".join(parts)
     
     def _format_western_contrasts(
         self,
@@ -240,75 +320,43 @@ class TheologicalContextBuilder:
     ) -> Dict[str, str]:
         """Generate guidance for each entry section"""
         
-        guidance = {}
+        themes = ', '.join(analysis.core_themes)
+        fathers = ', '.join(analysis.suggested_fathers[:5])
+        scriptures = ', '.join(analysis.suggested_scriptures[:5])
+        doctrines = ', '.join(analysis.related_doctrines)
+        related = ', '.join(semantic_map.related_concepts[:3])
         
-        # Introduction
-        guidance['Introduction'] = (
-            f"Introduce {topic} from Orthodox perspective. "
-            f"Preview the {len(analysis.core_themes)} main themes: {', '.join(analysis.core_themes)}. "
-            f"Establish contemporary relevance and Orthodox framing."
-        )
-        
-        # The Patristic Mind
-        guidance['The Patristic Mind'] = (
-            f"Engage deeply with these Church Fathers: {', '.join(analysis.suggested_fathers[:5])}. "
-            f"Focus on {analysis.theological_domain} theology. "
-            f"Cite specific works and provide quotations or paraphrases."
-        )
-        
-        # Symphony of Clashes
-        guidance['Symphony of Clashes'] = (
-            f"Present dialectical tensions in {topic}. "
-            f"Address philosophical and theological questions. "
-            f"Show how Orthodox theology navigates apparent paradoxes."
-        )
-        
-        # Orthodox Affirmation
-        guidance['Orthodox Affirmation'] = (
-            f"Clearly state Orthodox position on {topic}. "
-            f"Ground in Scripture: {', '.join(analysis.suggested_scriptures[:5])}. "
-            f"Show distinctions from Western theology. "
-            f"Connect to core doctrines: {', '.join(analysis.related_doctrines)}."
-        )
-        
-        # Synthesis
-        guidance['Synthesis'] = (
-            f"Integrate all threads into coherent Orthodox vision. "
-            f"Show how {semantic_map.central_concept} relates to {', '.join(semantic_map.related_concepts[:3])}. "
-            f"Provide practical applications for spiritual life."
-        )
-        
-        # Conclusion
-        guidance['Conclusion'] = (
-            f"Recap the journey through {topic}. "
-            f"Reaffirm Orthodox position with confidence and humility. "
-            f"Acknowledge mystery while celebrating revealed truth. "
-            f"End with doxological spirit."
-        )
-        
-        return guidance
-    
-    def _get_father_century(self, father: str) -> str:
-        """Get century in which Church Father lived"""
-        centuries = {
-            'St. Gregory of Nyssa': '4th',
-            'St. Maximus the Confessor': '7th',
-            'St. Basil the Great': '4th',
-            'St. John Chrysostom': '4th-5th',
-            'St. Athanasius': '4th',
-            'St. Gregory Palamas': '14th',
-            'St. John of Damascus': '8th',
-            'St. Gregory Nazianzen': '4th',
-            'St. Ignatius of Antioch': '1st-2nd',
-            'St. Irenaeus of Lyons': '2nd',
-            'St. Cyril of Alexandria': '5th',
-        }
-        return centuries.get(father, 'early')
-    
-    def _load_historical_patterns(self) -> Dict:
-        """Load historical development patterns"""
         return {
-            'trinitarian': 'Developed through 4th century Cappadocian synthesis',
-            'christological': 'Clarified through Ecumenical Councils 4th-7th centuries',
-            'hesychast': 'Synthesized by Gregory Palamas in 14th century',
+            'Introduction': (
+                f"Introduce {topic} from Orthodox perspective. "
+                f"Preview the {len(analysis.core_themes)} main themes: {themes}. "
+                "Establish contemporary relevance and Orthodox framing."
+            ),
+            'The Patristic Mind': (
+                f"Engage deeply with these Church Fathers: {fathers}. "
+                f"Focus on {analysis.theological_domain} theology. "
+                "Cite specific works and provide quotations or paraphrases."
+            ),
+            'Symphony of Clashes': (
+                f"Present dialectical tensions in {topic}. "
+                "Address philosophical and theological questions. "
+                "Show how Orthodox theology navigates apparent paradoxes."
+            ),
+            'Orthodox Affirmation': (
+                f"Clearly state Orthodox position on {topic}. "
+                f"Ground in Scripture: {scriptures}. "
+                "Show distinctions from Western theology. "
+                f"Connect to core doctrines: {doctrines}."
+            ),
+            'Synthesis': (
+                "Integrate all threads into coherent Orthodox vision. "
+                f"Show how {semantic_map.central_concept} relates to {related}. "
+                "Provide practical applications for spiritual life."
+            ),
+            'Conclusion': (
+                f"Recap the journey through {topic}. "
+                "Reaffirm Orthodox position with confidence and humility. "
+                "Acknowledge mystery while celebrating revealed truth. "
+                "End with doxological spirit."
+            ),
         }
@@ -9,18 +9,67 @@ Provides deep analysis of theological topics to extract:
 - Historical context
 """
 
+import functools
 import re
-from typing import Dict, List, Set, Optional
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass, replace
 
 
-@dataclass
+# Precompiled findall beats str.split/str.translate tokenization on topic-length
+# strings, and also splits on punctuation and non-ASCII letters for free
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Keyword stems signalling each core theme; a stem matches any topic word
+# that begins with it, so 'icon' also catches "iconography" and
+# 'sacrament' catches "sacramental"
+_TRINITY_STEMS = ('trinity', 'trinitarian')
+_CHRIST_STEMS = ('incarnation', 'christ', 'christology')
+_THEOSIS_STEMS = ('theosis', 'deification', 'salvation')
+_ENERGIES_STEMS = ('essence', 'energies')
+_CHURCH_STEMS = ('church', 'sacrament', 'liturgy', 'liturgical')
+_CREATION_STEMS = ('creation', 'cosmos', 'nature')
+_KNOWLEDGE_STEMS = ('knowledge', 'apophatic', 'mystery')
+_ICON_STEMS = ('icon', 'image', 'beauty')
+
+# Keyword stems signalling related doctrines beyond the Trinity and Incarnation
+_ECCLESIOLOGY_STEMS = ('church', 'sacrament')
+_VENERATION_STEMS = ('icon', 'image')
+
+# Topic words that raise complexity
+_INTERDISCIPLINARY_MARKERS = frozenset({'and', 'in', 'through', 'synthesis'})
+_ABSTRACT_TERMS = frozenset({'infinity', 'eternity', 'mystery', 'paradox', 'unknowable'})
+
+# Comprehensive list of theological terms
+_THEOLOGICAL_TERMS = frozenset({
+    'theosis', 'deification', 'incarnation', 'trinity', 'trinitarian',
+    'hypostasis', 'hypostatic', 'ousia', 'essence', 'energies',
+    'apophatic', 'cataphatic', 'perichoresis', 'kenosis',
+    'synergy', 'liturgy', 'sacrament', 'patristic',
+    'soteriology', 'ecclesiology', 'christology', 'pneumatology',
+    'eschatology', 'anthropology', 'cosmology'
+})
+
+
+def topic_tokens(topic: str) -> FrozenSet[str]:
+    """Words of a lowercased topic, with simple plurals also folded to singular"""
+    words = _WORD_RE.findall(topic)
+    return frozenset(words).union(
+        word[:-1] for word in words if len(word) > 3 and word.endswith('s')
+    )
+
+
+def _has_stem(tokens: FrozenSet[str], stems: Tuple[str, ...]) -> bool:
+    """Whether any topic word begins with one of stems"""
+    return any(token.startswith(stems) for token in tokens)
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class TopicAnalysis:
     """Results of topic analysis"""
     topic: str
     core_themes: List[str]
     theological_domain: str
-    suggested_fathers: List[str]
+    suggested_fathers: List[str]  # priority order, domain specialists first
     suggested_scriptures: List[str]
     related_doctrines: List[str]
     complexity_score: float
@@ -33,6 +82,13 @@ class TopicAnalyzer:
     and provide preprocessing guidance for generation
     """
     
+    __slots__ = (
+        'theological_terms',
+        '_analyze_cached',
+        '_domain_stems',
+        '_domain_phrases',
+    )
+    
     # Theological domain keywords
     DOMAIN_KEYWORDS = {
         'trinitarian': ['trinity', 'trinitarian', 'father', 'son', 'spirit', 'persons', 'hypostases'],
@@ -57,9 +113,27 @@ class TopicAnalyzer:
         'epistemological': ['St. Gregory Palamas', 'St. Dionysius the Areopagite', 'St. Maximus the Confessor'],
     }
     
+    # Distinct topics whose analyses are remembered per analyzer
+    ANALYSIS_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the topic analyzer"""
-        self.theological_terms = self._load_theological_terms()
+        self.theological_terms = _THEOLOGICAL_TERMS
+        self._analyze_cached = functools.lru_cache(
+            maxsize=self.ANALYSIS_CACHE_SIZE
+        )(self._analyze)
+        
+        # Single-word domain keywords are matched as stems of topic words,
+        # so "person" no longer hits 'son' but "trinitarianism" still hits
+        # 'trinitarian'; phrases such as 'divine nature' keep a substring check
+        self._domain_stems = {
+            domain: tuple(kw for kw in keywords if ' ' not in kw)
+            for domain, keywords in self.DOMAIN_KEYWORDS.items()
+        }
+        self._domain_phrases = {
+            domain: tuple(kw for kw in keywords if ' ' in kw)
+            for domain, keywords in self.DOMAIN_KEYWORDS.items()
+        }
         
     def analyze(self, topic: str) -> TopicAnalysis:
         """
@@ -71,14 +145,29 @@ class TopicAnalyzer:
         Returns:
             TopicAnalysis object with detailed analysis results
         """
+        analysis = self._analyze_cached(topic)
+        
+        # Analyses are memoized per topic; hand out fresh lists so callers
+        # can extend suggestions without touching the cached copy
+        return replace(
+            analysis,
+            core_themes=list(analysis.core_themes),
+            suggested_fathers=list(analysis.suggested_fathers),
+            suggested_scriptures=list(analysis.suggested_scriptures),
+            related_doctrines=list(analysis.related_doctrines)
+        )
+    
+    def _analyze(self, topic: str) -> TopicAnalysis:
+        """Uncached body of analyze"""
         # Normalize topic
         topic_lower = topic.lower()
+        tokens = topic_tokens(topic_lower)
         
         # Extract core themes
-        core_themes = self._extract_core_themes(topic_lower)
+        core_themes = self._extract_core_themes(topic_lower, tokens)
         
         # Identify theological domain
-        theological_domain = self._identify_domain(topic_lower)
+        theological_domain = self._identify_domain(topic_lower, tokens)
         
         # Suggest relevant Church Fathers
         suggested_fathers = self._suggest_fathers(theological_domain, topic_lower)
@@ -87,10 +176,10 @@ class TopicAnalyzer:
         suggested_scriptures = self._suggest_scriptures(theological_domain, topic_lower)
         
         # Identify related doctrines
-        related_doctrines = self._identify_related_doctrines(topic_lower)
+        related_doctrines = self._identify_related_doctrines(tokens)
         
         # Calculate complexity
-        complexity_score = self._calculate_complexity(topic_lower, core_themes)
+        complexity_score = self._calculate_complexity(tokens, core_themes)
         
         # Determine depth required
         depth_required = self._determine_depth_required(complexity_score)
@@ -106,66 +195,75 @@ class TopicAnalyzer:
             estimated_depth_required=depth_required
         )
     
-    def _extract_core_themes(self, topic: str) -> List[str]:
+    def _extract_core_themes(self, topic: str, tokens: FrozenSet[str]) -> List[str]:
         """Extract core theological themes from topic"""
         themes = []
         
         # Check for major theological concepts
-        if any(word in topic for word in ['trinity', 'trinitarian', 'three persons']):
+        if _has_stem(tokens, _TRINITY_STEMS) or 'three persons' in topic:
             themes.append('Trinitarian theology')
-        if any(word in topic for word in ['incarnation', 'christ', 'christology']):
+        if _has_stem(tokens, _CHRIST_STEMS):
             themes.append('Christology')
-        if any(word in topic for word in ['theosis', 'deification', 'salvation']):
+        if _has_stem(tokens, _THEOSIS_STEMS):
             themes.append('Theosis and Soteriology')
-        if any(word in topic for word in ['essence', 'energies', 'divine energies']):
+        if _has_stem(tokens, _ENERGIES_STEMS):
             themes.append('Essence-Energies distinction')
-        if any(word in topic for word in ['church', 'sacrament', 'liturgy']):
+        if _has_stem(tokens, _CHURCH_STEMS):
             themes.append('Ecclesiology and Liturgical life')
-        if any(word in topic for word in ['creation', 'cosmos', 'nature']):
+        if _has_stem(tokens, _CREATION_STEMS):
             themes.append('Cosmology and Creation')
-        if any(word in topic for word in ['knowledge', 'apophatic', 'mystery']):
+        if _has_stem(tokens, _KNOWLEDGE_STEMS):
             themes.append('Theological epistemology')
-        if any(word in topic for word in ['icon', 'image', 'beauty']):
+        if _has_stem(tokens, _ICON_STEMS):
             themes.append('Iconography and aesthetics')
             
         return themes if themes else ['General Orthodox theology']
     
-    def _identify_domain(self, topic: str) -> str:
+    def _identify_domain(self, topic: str, tokens: FrozenSet[str]) -> str:
         """Identify primary theological domain"""
         domain_scores = {}
         
-        for domain, keywords in self.DOMAIN_KEYWORDS.items():
-            score = sum(1 for keyword in keywords if keyword in topic)
+        for domain, stems in self._domain_stems.items():
+            score = sum(
+                1 for stem in stems
+                if any(token.startswith(stem) for token in tokens)
+            ) + sum(
+                1 for phrase in self._domain_phrases[domain] if phrase in topic
+            )
             if score > 0:
                 domain_scores[domain] = score
         
         if domain_scores:
-            return max(domain_scores.items(), key=lambda x: x[1])[0]
+            return max(domain_scores, key=domain_scores.get)
         return 'general'
     
     def _suggest_fathers(self, domain: str, topic: str) -> List[str]:
-        """Suggest relevant Church Fathers based on domain"""
-        fathers = set()
+        """
+        Suggest relevant Church Fathers based on domain
         
-        # Domain-specific fathers
-        if domain in self.FATHER_SPECIALIZATIONS:
-            fathers.update(self.FATHER_SPECIALIZATIONS[domain])
+        Fathers are returned in priority order rather than alphabetically:
+        domain specialists in their curated order, then the foundational
+        fathers, then topic-specific additions. Callers that take a prefix
+        such as suggested_fathers[:5] therefore keep the most relevant ones.
+        """
+        # dict.fromkeys deduplicates without disturbing that order
+        fathers = dict.fromkeys(self.FATHER_SPECIALIZATIONS.get(domain, ()))
         
         # Always include foundational fathers
-        fathers.add('St. Maximus the Confessor')
-        fathers.add('St. Gregory of Nyssa')
+        fathers['St. Maximus the Confessor'] = None
+        fathers['St. Gregory of Nyssa'] = None
         
         # Topic-specific additions
         if 'palamas' in topic or 'hesychasm' in topic or 'energies' in topic:
-            fathers.add('St. Gregory Palamas')
+            fathers['St. Gregory Palamas'] = None
         if 'damascus' in topic or 'icon' in topic:
-            fathers.add('St. John of Damascus')
+            fathers['St. John of Damascus'] = None
         if 'liturgy' in topic or 'worship' in topic:
-            fathers.add('St. John Chrysostom')
+            fathers['St. John Chrysostom'] = None
         if 'athanasius' in topic or 'arius' in topic:
-            fathers.add('St. Athanasius')
+            fathers['St. Athanasius'] = None
             
-        return sorted(list(fathers))
+        return list(fathers)
     
     def _suggest_scriptures(self, domain: str, topic: str) -> List[str]:
         """Suggest relevant Scripture passages"""
@@ -193,7 +291,7 @@ class TopicAnalyzer:
             
         return scriptures if scriptures else ['John 1:1-14', 'Romans 8:29-30']
     
-    def _identify_related_doctrines(self, topic: str) -> List[str]:
+    def _identify_related_doctrines(self, tokens: FrozenSet[str]) -> List[str]:
         """Identify related Orthodox doctrines"""
         doctrines = []
         
@@ -202,18 +300,18 @@ class TopicAnalyzer:
         doctrines.append('Incarnation')
         
         # Topic-specific
-        if any(word in topic for word in ['salvation', 'theosis', 'deification']):
+        if _has_stem(tokens, _THEOSIS_STEMS):
             doctrines.append('Theosis')
-        if any(word in topic for word in ['church', 'sacrament']):
+        if _has_stem(tokens, _ECCLESIOLOGY_STEMS):
             doctrines.append('Ecclesiology')
-        if any(word in topic for word in ['energies', 'essence']):
+        if _has_stem(tokens, _ENERGIES_STEMS):
             doctrines.append('Essence-Energies distinction')
-        if any(word in topic for word in ['icon', 'image']):
+        if _has_stem(tokens, _VENERATION_STEMS):
             doctrines.append('Veneration of icons')
             
         return doctrines
     
-    def _calculate_complexity(self, topic: str, themes: List[str]) -> float:
+    def _calculate_complexity(self, tokens: FrozenSet[str], themes: List[str]) -> float:
         """Calculate topic complexity score (0.0-1.0)"""
         complexity = 0.5  # Base complexity
         
@@ -221,12 +319,10 @@ class TopicAnalyzer:
         complexity += len(themes) * 0.05
         
         # Interdisciplinary topics are more complex
-        interdisciplinary_markers = ['and', 'in', 'through', 'synthesis']
-        complexity += sum(0.1 for marker in interdisciplinary_markers if marker in topic)
+        complexity += sum(0.1 for _ in _INTERDISCIPLINARY_MARKERS & tokens)
         
         # Abstract concepts are more complex
-        abstract_terms = ['infinity', 'eternity', 'mystery', 'paradox', 'unknowable']
-        complexity += sum(0.1 for term in abstract_terms if term in topic)
+        complexity += sum(0.1 for _ in _ABSTRACT_TERMS & tokens)
         
         return min(1.0, complexity)
     
@@ -238,14 +334,3 @@ class TopicAnalyzer:
             return 'intermediate'
         else:
             return 'foundational'
-    
-    def _load_theological_terms(self) -> Set[str]:
-        """Load comprehensive list of theological terms"""
-        return {
-            'theosis', 'deification', 'incarnation', 'trinity', 'trinitarian',
-            'hypostasis', 'hypostatic', 'ousia', 'essence', 'energies',
-            'apophatic', 'cataphatic', 'perichoresis', 'kenosis',
-            'synergy', 'liturgy', 'sacrament', 'patristic',
-            'soteriology', 'ecclesiology', 'christology', 'pneumatology',
-            'eschatology', 'anthropology', 'cosmology'
-        }
@@ -8,9 +8,15 @@ from typing import List, Tuple
 import re
 
 
+# Pattern: St. [Name] in [Work]
+_CITATION_RE = re.compile(r'St\.\s+([\w\s]+?)\s+in\s+([^,\.]+)')
+
+
 class CitationValidator:
     """Validates Patristic citations against verified database"""
     
+    __slots__ = ('database',)
+    
     def __init__(self, citation_database):
         """
         Initialize with citation database
@@ -33,29 +39,21 @@ class CitationValidator:
         # Extract all citations
         citations = self._extract_citations(content)
         
-        verified = 0
-        flagged = []
+        results = self.database.batch_verify(citations)
         
-        for father, work in citations:
-            if self.database.verify_citation(father, work):
-                verified += 1
-            else:
-                flagged.append(f"{father}: {work}")
+        verified = sum(results)
+        flagged = [
+            f"{father}: {work}"
+            for (father, work), ok in zip(citations, results)
+            if not ok
+        ]
         
         total = len(citations)
         return verified, total, flagged
     
     def _extract_citations(self, content: str) -> List[Tuple[str, str]]:
         """Extract (father, work) pairs from content"""
-        citations = []
-        
-        # Pattern: St. [Name] in [Work]
-        pattern = r'St\.\s+([\w\s]+?)\s+in\s+([^,\.]+)'
-        matches = re.finditer(pattern, content)
-        
-        for match in matches:
-            father = f"St. {match.group(1).strip()}"
-            work = match.group(2).strip()
-            citations.append((father, work))
-        
-        return citations
+        return [
+            (f"St. {match.group(1).strip()}", match.group(2).strip())
+            for match in _CITATION_RE.finditer(content)
+        ]
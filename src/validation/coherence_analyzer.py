@@ -8,13 +8,15 @@ Validates:
 - Argument structure
 """
 
-from typing import List, Dict
+from typing import List, Dict, Set
 import re
 
 
 class CoherenceAnalyzer:
     """Analyzes coherence and structural integrity of entries"""
     
+    __slots__ = ()
+    
     def analyze_coherence(self, sections: List) -> Dict[str, any]:
         """
         Analyze entry coherence
@@ -25,11 +27,17 @@ class CoherenceAnalyzer:
         Returns:
             Dict with coherence metrics
         """
+        # Lowercase every section name once for all checks below
+        lowered_names = [s.name.lower() for s in sections]
+        
+        # Find which section names each section mentions
+        mentions = self._find_section_mentions(sections, lowered_names)
+        
         # Count cross-references
-        cross_refs = self._count_cross_references(sections)
+        cross_refs = self._count_cross_references(sections, lowered_names, mentions)
         
         # Check logical flow
-        flow_score = self._analyze_flow(sections)
+        flow_score = self._analyze_flow(lowered_names, mentions)
         
         # Check thematic consistency
         consistency_score = self._analyze_consistency(sections)
@@ -41,43 +49,79 @@ class CoherenceAnalyzer:
             'overall_coherence': (flow_score + consistency_score) / 2
         }
     
-    def _count_cross_references(self, sections: List) -> int:
-        """Count cross-references between sections"""
-        count = 0
-        section_names = [s.name for s in sections]
+    def _find_section_mentions(
+        self,
+        sections: List,
+        lowered_names: List[str]
+    ) -> List[Set[str]]:
+        """Lowercased section names mentioned in each section's content"""
+        names = set(lowered_names)
         
+        # A single scan reports one name per position, so names contained in
+        # another name are checked directly; the rest share one pattern,
+        # wrapped in a lookahead so overlapping mentions are all found
+        nested = {
+            name for name in names
+            if any(name != other and name in other for other in names)
+        }
+        scanned = sorted(names - nested, key=len, reverse=True)
+        pattern = re.compile(
+            '(?=(' + '|'.join(map(re.escape, scanned)) + '))'
+        ) if scanned else None
+        
+        mentions = []
         for section in sections:
-            for other_name in section_names:
-                if other_name != section.name:
-                    # Check if other section is mentioned
-                    if other_name.lower() in section.content.lower():
-                        count += 1
+            content = section.content.lower()
+            found = set(pattern.findall(content)) if pattern else set()
+            found.update(name for name in nested if name in content)
+            mentions.append(found)
+        
+        return mentions
+    
+    def _count_cross_references(
+        self,
+        sections: List,
+        lowered_names: List[str],
+        mentions: List[Set[str]]
+    ) -> int:
+        """Count cross-references between sections"""
+        section_names = [(s.name, lowered) for s, lowered in zip(sections, lowered_names)]
         
-        return count
+        # Each mention of another section (by name) counts once per section.
+        # A nested generator measured faster than itertools.product here:
+        # unpacking the paired tuples costs more than the inner FOR_ITER
+        return sum(
+            1
+            for section, found in zip(sections, mentions)
+            for other_name, other_lower in section_names
+            if other_name != section.name and other_lower in found
+        )
     
-    def _analyze_flow(self, sections: List) -> float:
+    def _analyze_flow(
+        self,
+        lowered_names: List[str],
+        mentions: List[Set[str]]
+    ) -> float:
         """Analyze logical flow (0-100)"""
         score = 70.0  # Base score
         
         # Check introduction previews
-        if sections:
-            intro = sections[0]
-            if 'introduction' in intro.name.lower():
+        if lowered_names:
+            if 'introduction' in lowered_names[0]:
                 # Should preview other sections
                 previewed = sum(
-                    1 for s in sections[1:]
-                    if s.name.lower() in intro.content.lower()
+                    1 for name in lowered_names[1:]
+                    if name in mentions[0]
                 )
                 score += min(20.0, previewed * 4.0)
         
         # Check conclusion recaps
-        if len(sections) > 1:
-            conclusion = sections[-1]
-            if 'conclusion' in conclusion.name.lower():
+        if len(lowered_names) > 1:
+            if 'conclusion' in lowered_names[-1]:
                 # Should reference previous sections
                 referenced = sum(
-                    1 for s in sections[:-1]
-                    if s.name.lower() in conclusion.content.lower()
+                    1 for name in lowered_names[:-1]
+                    if name in mentions[-1]
                 )
                 score += min(10.0, referenced * 2.0)
         
@@ -13,7 +13,17 @@ from dataclasses import dataclass
 import re
 
 
-@dataclass
+# Runs of whitespace collapse to one space so multi-word names can be
+# found with plain substring search; all scans run over lowercased content
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize(content: str) -> str:
+    """Collapse whitespace runs in content to single spaces"""
+    return _WHITESPACE_RE.sub(' ', content)
+
+
+@dataclass(slots=True)
 class QualityMetrics:
     """Quality metrics results"""
     diversity_score: float  # 0-100
@@ -23,6 +33,14 @@ class QualityMetrics:
     composite_score: float  # 0-100
     passed: bool
     details: Dict[str, any]
+
+
+@dataclass(slots=True, frozen=True)
+class _SectionScan:
+    """Patristic signals found in one section's content"""
+    father_citations: int
+    has_patristic_term: bool  # 'Patristic' or 'Fathers'
+    has_church_father: bool  # 'Church Father'
     
 
 class QualityScorer:
@@ -37,41 +55,48 @@ class QualityScorer:
     INTEGRATION_THRESHOLD = 70.0  # Acceptable distribution
     DISTRIBUTION_THRESHOLD = 85.0  # 4+ sections with Patristic content
     
-    # Church Father patterns
-    FATHER_PATTERNS = [
-        r'St\.\s+Gregory\s+of\s+Nyssa',
-        r'St\.\s+Maximus\s+the\s+Confessor',
-        r'St\.\s+Basil\s+the\s+Great',
-        r'St\.\s+John\s+Chrysostom',
-        r'St\.\s+Athanasius',
-        r'St\.\s+Gregory\s+Palamas',
-        r'St\.\s+John\s+of\s+Damascus',
-        r'St\.\s+Ignatius',
-        r'St\.\s+Irenaeus',
-        r'St\.\s+Cyril\s+of\s+Alexandria',
-        r'St\.\s+Gregory\s+Nazianzen',
+    # Church Fathers, matched case-insensitively with any whitespace
+    # between words
+    FATHER_NAMES = [
+        'St. Gregory of Nyssa',
+        'St. Maximus the Confessor',
+        'St. Basil the Great',
+        'St. John Chrysostom',
+        'St. Athanasius',
+        'St. Gregory Palamas',
+        'St. John of Damascus',
+        'St. Ignatius',
+        'St. Irenaeus',
+        'St. Cyril of Alexandria',
+        'St. Gregory Nazianzen',
     ]
     
-    # Work title patterns
-    WORK_PATTERNS = [
-        r'On\s+the\s+Making\s+of\s+Man|De\s+Hominis\s+Opificio',
-        r'Ambigua|Difficulties',
-        r'On\s+the\s+Holy\s+Spirit|De\s+Spiritu\s+Sancto',
-        r'Homilies\s+on|Commentary\s+on',
-        r'Against\s+the\s+Heathen|Contra\s+Gentes',
-        r'Triads\s+in\s+Defense|Triads',
-        r'Exact\s+Exposition\s+of\s+the\s+Orthodox\s+Faith',
-        r'Ladder\s+of\s+Divine\s+Ascent',
-        r'Life\s+of\s+Moses|De\s+Vita\s+Moysis',
-        r'On\s+the\s+Incarnation|De\s+Incarnatione',
-        r'Hexaemeron',
-        r'Mystagogy',
-        r'Chapters\s+on\s+Charity',
+    # Work titles; each tuple lists the names one work may be cited by
+    WORK_TITLES = [
+        ('On the Making of Man', 'De Hominis Opificio'),
+        ('Ambigua', 'Difficulties'),
+        ('On the Holy Spirit', 'De Spiritu Sancto'),
+        ('Homilies on', 'Commentary on'),
+        ('Against the Heathen', 'Contra Gentes'),
+        ('Triads in Defense', 'Triads'),
+        ('Exact Exposition of the Orthodox Faith',),
+        ('Ladder of Divine Ascent',),
+        ('Life of Moses', 'De Vita Moysis'),
+        ('On the Incarnation', 'De Incarnatione'),
+        ('Hexaemeron',),
+        ('Mystagogy',),
+        ('Chapters on Charity',),
     ]
     
     def __init__(self):
         """Initialize quality scorer"""
-        pass
+        self._father_names = tuple(name.lower() for name in self.FATHER_NAMES)
+        # (lowercased title, index of the work it names)
+        self._work_titles = tuple(
+            (title.lower(), work_id)
+            for work_id, titles in enumerate(self.WORK_TITLES)
+            for title in titles
+        )
     
     def calculate_quality_metrics(self, sections: List) -> QualityMetrics:
         """
@@ -83,14 +108,26 @@ class QualityScorer:
         Returns:
             QualityMetrics with all scores
         """
-        # Combine all content
-        total_content = " ".join(s.content for s in sections)
+        # Lowercase each section once; every scan is case-insensitive
+        section_lowers = [s.content.lower() for s in sections]
+        
+        # Combine all content, normalized separately since joining can
+        # put two whitespace runs side by side
+        content_lower = _normalize(" ".join(section_lowers))
+        
+        # Scan each section once for the per-section metrics
+        scans = self._scan_sections(section_lowers)
+        
+        # Distinct fathers and works across the whole entry
+        fathers_cited = self._count_fathers_cited(content_lower)
+        works_cited = self._count_works_cited(content_lower)
         
         # Calculate individual scores
-        diversity = self._calculate_diversity_score(total_content)
-        specificity = self._calculate_specificity_score(total_content)
-        integration = self._calculate_integration_score(sections)
-        distribution = self._calculate_distribution_score(sections)
+        diversity = self._calculate_diversity_score(fathers_cited)
+        specificity = self._calculate_specificity_score(works_cited)
+        citation_std_dev = self._calculate_citation_variance(scans)
+        integration = self._calculate_integration_score(scans, citation_std_dev)
+        distribution = self._calculate_distribution_score(scans)
         
         # Calculate composite score (weighted)
         composite = (
@@ -110,10 +147,10 @@ class QualityScorer:
         
         # Collect details
         details = {
-            'fathers_cited': self._count_fathers_cited(total_content),
-            'works_cited': self._count_works_cited(total_content),
-            'sections_with_patristic': self._count_sections_with_patristic(sections),
-            'citation_distribution_variance': self._calculate_citation_variance(sections),
+            'fathers_cited': fathers_cited,
+            'works_cited': works_cited,
+            'sections_with_patristic': self._count_sections_with_patristic(scans),
+            'citation_distribution_variance': citation_std_dev,
         }
         
         return QualityMetrics(
@@ -126,19 +163,26 @@ class QualityScorer:
             details=details
         )
     
-    def _calculate_diversity_score(self, content: str) -> float:
+    def _scan_sections(self, section_lowers: List[str]) -> List[_SectionScan]:
+        """Collect each lowercased section's Patristic signals"""
+        scans = []
+        for content in map(_normalize, section_lowers):
+            scans.append(_SectionScan(
+                # No name can overlap itself or start where another does,
+                # so summing non-overlapping counts counts every citation
+                father_citations=sum(
+                    content.count(name) for name in self._father_names
+                ),
+                has_patristic_term='patristic' in content or 'fathers' in content,
+                has_church_father='church father' in content,
+            ))
+        return scans
+    
+    def _calculate_diversity_score(self, diversity_count: int) -> float:
         """
         Calculate diversity score (citation breadth)
         Checks that 5+ different Church Fathers are cited
         """
-        fathers_cited = set()
-        
-        for pattern in self.FATHER_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                fathers_cited.add(pattern)
-        
-        diversity_count = len(fathers_cited)
-        
         if diversity_count >= 5:
             return 100.0
         elif diversity_count == 4:
@@ -148,17 +192,11 @@ class QualityScorer:
         else:
             return 40.0
     
-    def _calculate_specificity_score(self, content: str) -> float:
+    def _calculate_specificity_score(self, works_cited: int) -> float:
         """
         Calculate specificity score (named works)
         Ensures 3+ specific Patristic works are named
         """
-        works_cited = 0
-        
-        for pattern in self.WORK_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                works_cited += 1
-        
         if works_cited >= 3:
             return 100.0
         elif works_cited == 2:
@@ -168,34 +206,20 @@ class QualityScorer:
         else:
             return 20.0
     
-    def _calculate_integration_score(self, sections: List) -> float:
+    def _calculate_integration_score(
+        self, scans: List[_SectionScan], std_dev: float
+    ) -> float:
         """
         Calculate integration score (natural flow)
         Verifies citations flow naturally, not isolated
-        """
-        section_citation_counts = []
         
-        for section in sections:
-            citation_count = sum(
-                len(re.findall(pattern, section.content, re.IGNORECASE))
-                for pattern in self.FATHER_PATTERNS
-            )
-            section_citation_counts.append(citation_count)
-        
-        if not section_citation_counts:
-            return 50.0
-        
-        # Calculate variance
-        mean_citations = sum(section_citation_counts) / len(section_citation_counts)
-        if mean_citations == 0:
+        std_dev is the spread of per-section citation counts, as computed
+        by _calculate_citation_variance
+        """
+        # No sections, or no citations anywhere
+        if not any(scan.father_citations for scan in scans):
             return 50.0
         
-        variance = sum(
-            (x - mean_citations) ** 2
-            for x in section_citation_counts
-        ) / len(section_citation_counts)
-        std_dev = variance ** 0.5
-        
         # Lower variance = better distribution
         if std_dev < 2:
             return 100.0
@@ -206,31 +230,18 @@ class QualityScorer:
         else:
             return 50.0
     
-    def _calculate_distribution_score(self, sections: List) -> float:
+    def _calculate_distribution_score(self, scans: List[_SectionScan]) -> float:
         """
         Calculate distribution score
         Confirms Patristic content appears across multiple sections
         """
-        patristic_sections = 0
-        
-        for section in sections:
-            # Check for Father citations
-            has_father_citation = any(
-                re.search(pattern, section.content, re.IGNORECASE)
-                for pattern in self.FATHER_PATTERNS
-            )
-            
-            # Check for Patristic terms
-            has_patristic_terms = bool(
-                re.search(
-                    r'Patristic|Fathers|Church\s+Father',
-                    section.content,
-                    re.IGNORECASE
-                )
-            )
-            
-            if has_father_citation or has_patristic_terms:
-                patristic_sections += 1
+        # Father citations or Patristic terms (including 'Church Father')
+        patristic_sections = sum(
+            1 for scan in scans
+            if scan.father_citations
+            or scan.has_patristic_term
+            or scan.has_church_father
+        )
         
         # Expect Patristic content in at least 4 of 6 sections
         if patristic_sections >= 5:
@@ -243,42 +254,25 @@ class QualityScorer:
             return 40.0
     
     def _count_fathers_cited(self, content: str) -> int:
-        """Count number of different fathers cited"""
-        return sum(
-            1 for pattern in self.FATHER_PATTERNS
-            if re.search(pattern, content, re.IGNORECASE)
-        )
+        """Count number of different fathers cited in normalized content"""
+        return sum(1 for name in self._father_names if name in content)
     
     def _count_works_cited(self, content: str) -> int:
-        """Count number of specific works cited"""
-        return sum(
-            1 for pattern in self.WORK_PATTERNS
-            if re.search(pattern, content, re.IGNORECASE)
-        )
+        """Count number of specific works cited in normalized content"""
+        return len({
+            work_id for title, work_id in self._work_titles if title in content
+        })
     
-    def _count_sections_with_patristic(self, sections: List) -> int:
+    def _count_sections_with_patristic(self, scans: List[_SectionScan]) -> int:
         """Count sections with Patristic content"""
-        count = 0
-        for section in sections:
-            has_content = any(
-                re.search(pattern, section.content, re.IGNORECASE)
-                for pattern in self.FATHER_PATTERNS
-            ) or bool(re.search(r'Patristic|Fathers', section.content, re.IGNORECASE))
-            
-            if has_content:
-                count += 1
-        
-        return count
+        return sum(
+            1 for scan in scans
+            if scan.father_citations or scan.has_patristic_term
+        )
     
-    def _calculate_citation_variance(self, sections: List) -> float:
+    def _calculate_citation_variance(self, scans: List[_SectionScan]) -> float:
         """Calculate variance in citation distribution"""
-        counts = []
-        for section in sections:
-            count = sum(
-                len(re.findall(pattern, section.content, re.IGNORECASE))
-                for pattern in self.FATHER_PATTERNS
-            )
-            counts.append(count)
+        counts = [scan.father_citations for scan in scans]
         
         if not counts:
             return 0.0
@@ -0,0 +1,24 @@
+"""
+Tests for TopicAnalyzer depth classification
+"""
+
+import pytest
+
+from src.preprocessing.topic_analyzer import TopicAnalyzer
+
+
+# Markers match whole topic words, so 'in' no longer counts inside
+# "Divine", "Infinity" or "Incarnation"
+@pytest.mark.parametrize("topic, complexity, depth", [
+    ("Divine Essence and Energies", 0.65, 'intermediate'),
+    ("Quantum Physics and Divine Energies", 0.65, 'intermediate'),
+    ("Mathematical Infinity", 0.65, 'intermediate'),
+    ("The Holy Trinity", 0.55, 'intermediate'),
+    ("Eternity and Infinity", 0.85, 'advanced'),
+    ("Paradox and mystery in the Trinity", 1.0, 'advanced'),
+])
+def test_depth_required(topic, complexity, depth):
+    analysis = TopicAnalyzer().analyze(topic)
+
+    assert analysis.complexity_score == pytest.approx(complexity)
+    assert analysis.estimated_depth_required == depth